@@ -5,40 +5,155 @@ COMPLETE VERSION with Data Availability Checker
 """
 
 import streamlit as st
+from streamlit import runtime
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Sequence, NamedTuple
+import csv
+import io
 import json
+import hashlib
+import math
+import logging
+import re
+import sys
+import warnings
+import types
 from datetime import datetime
+from pathlib import Path
 import time
-from collections import defaultdict
+import threading
+from collections import defaultdict, OrderedDict
+from concurrent.futures import ThreadPoolExecutor, Future, as_completed
+from functools import lru_cache, wraps
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional incremental parser for large data pages
+    ijson = None
+
+if orjson is not None:
+    json_loads = orjson.loads
+    json_dumps = orjson.dumps
+else:
+    json_loads = json.loads
+
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
 
 
 # ============================================================================
 # DATA360 CLIENT
 # ============================================================================
 
+# series_description fields requested by search
+FULL_FIELDS = ("idno", "name", "database_id", "description", "topics", "source")
+MINIMAL_FIELDS = ("idno", "name")
+LIST_FIELDS = ("idno", "name", "database_id")
+
+
+def odata_quote(value: str) -> str:
+    """Quote a value as an OData string literal"""
+    return "'" + value.replace("'", "''") + "'"
+
+
+@lru_cache(maxsize=4096)
+def build_metadata_query(indicator_id: str) -> str:
+    """OData filter selecting a single indicator's metadata"""
+    return f"&$filter=series_description/idno eq {odata_quote(indicator_id)}"
+
+
+@lru_cache(maxsize=1024)
+def build_database_filter(database_ids: Tuple[str, ...]) -> str:
+    """OData filter matching any of the databases"""
+    return "(" + " or ".join(f"series_description/database_id eq {odata_quote(db)}" for db in database_ids) + ")"
+
+
+@lru_cache(maxsize=1024)
+def build_theme_filter(themes: Tuple[str, ...]) -> str:
+    """OData filter matching indicators tagged with any of the themes"""
+    return "(" + " or ".join(f"series_description/topics/any(t: t/name eq {odata_quote(theme)})" for theme in themes) + ")"
+
+
+class PartialDataError(requests.RequestException):
+    """Some areas of a multi-area fetch failed; data holds the areas that succeeded"""
+    
+    def __init__(self, data: Dict, failed: List[str]):
+        super().__init__(f"Could not fetch {', '.join(failed)}")
+        self.data = data
+        self.failed = failed
+
+
 class Data360Client:
     """Complete Data360 API Client"""
     BASE_URL = "https://data360api.worldbank.org"
-    
+    MAX_WORKERS = 8
+    # Batch downloads fan out MAX_WORKERS fetches that each paginate with MAX_WORKERS more
+    POOL_SIZE = MAX_WORKERS * MAX_WORKERS
+    METADATA_BATCH_SIZE = 50
+    VALIDATOR_CACHE_SIZE = 256
+    STREAM_THRESHOLD = 2 * 1024 * 1024
+    CONNECT_TIMEOUT = 5
+    USER_AGENT = "Data360Explorer/1.0"
+
     def __init__(self, timeout: int = 30):
-        self.timeout = timeout
+        # An unreachable host fails fast instead of using up the read timeout on every retry
+        self.timeout = (self.CONNECT_TIMEOUT, timeout)
         self.session = requests.Session()
+
+        # Keep-alive pool sized for concurrent fetches, retrying transient errors
+        retry = Retry(total=3, backoff_factor=0.2,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      allowed_methods=["GET", "POST"])
+        adapter = HTTPAdapter(pool_connections=self.POOL_SIZE, pool_maxsize=self.POOL_SIZE,
+                              max_retries=retry)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update({"Accept-Encoding": ACCEPT_ENCODING, "Connection": "keep-alive",
+                                     "User-Agent": self.USER_AGENT})
+        
+        # (url, params) -> (ETag, Last-Modified, body) for conditional GETs
+        self._validators = OrderedDict()
+        self._validators_lock = threading.Lock()
         
+        # (kind, url, params) -> Future shared by concurrent identical GETs
+        self._inflight: Dict[Tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def search(self, query: str, top: int = 100, skip: int = 0, 
-               filter_by: Optional[str] = None, orderby: Optional[str] = None) -> Dict:
-        """Search Data360 - avoids wildcard searches"""
+               filter_by: Optional[str] = None, orderby: Optional[str] = None,
+               fields: Sequence[str] = FULL_FIELDS, raise_errors: bool = False) -> Dict:
+        """Search Data360 - avoids wildcard searches
+        
+        Pass fields=MINIMAL_FIELDS when only ids and names are needed.
+        """
         url = f"{self.BASE_URL}/data360/searchv2"
         
         if not query or query.strip() == "" or query == "*":
+            warnings.warn("Empty/wildcard searches fall back to 'GDP'; browse with list_indicators instead",
+                          DeprecationWarning, stacklevel=2)
             query = "GDP"
         
         payload = {
             "count": True,
-            "select": "series_description/idno, series_description/name, series_description/database_id, series_description/description, series_description/topics, series_description/source",
+            "select": ", ".join(f"series_description/{field}" for field in fields),
             "search": query,
             "top": top,
             "skip": skip
@@ -50,38 +165,142 @@ class Data360Client:
             payload["orderby"] = orderby
             
         try:
-            response = self.session.post(url, json=payload, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            return self._post_json(url, payload)
         except Exception as e:
-            print(f"Search API Error: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Response status: {e.response.status_code}")
-                print(f"Response body: {e.response.text}")
+            if raise_errors:
+                raise
+            logger.exception("Search API error")
+            response = getattr(e, 'response', None)
+            if response is not None and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Response status: %s, body: %s", response.status_code, response.text)
             return {"value": [], "@odata.count": 0}
     
     def list_indicators(self, database_id: str) -> List[str]:
         """List all indicators in a database"""
         url = f"{self.BASE_URL}/data360/indicators"
         params = {"datasetId": database_id}
-        response = self.session.get(url, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        return response.json()
+        return self._get_json(url, params)
     
     def get_indicator_metadata(self, indicator_id: str) -> Dict:
         """Get detailed metadata for an indicator"""
         url = f"{self.BASE_URL}/data360/metadata"
-        query = f"&$filter=series_description/idno eq '{indicator_id}'"
-        payload = {"query": query}
-        response = self.session.post(url, json=payload, timeout=self.timeout)
+        payload = {"query": build_metadata_query(indicator_id)}
+        return self._post_json(url, payload)
+    
+    def get_indicators_metadata(self, indicator_ids: List[str]) -> Dict[str, Dict]:
+        """Get metadata for many indicators in batched queries, keyed by indicator id"""
+        url = f"{self.BASE_URL}/data360/metadata"
+        chunks = [indicator_ids[i:i + self.METADATA_BATCH_SIZE]
+                  for i in range(0, len(indicator_ids), self.METADATA_BATCH_SIZE)]
+        
+        def fetch_chunk(chunk: List[str]) -> List[Dict]:
+            query = f"&$filter=search.in(series_description/idno, {odata_quote(','.join(chunk))}, ',')"
+            return self._post_json(url, {"query": query}).get("value", [])
+        
+        metadata = {}
+        if not chunks:
+            return metadata
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(chunks))) as executor:
+            for items in executor.map(fetch_chunk, chunks):
+                for item in items:
+                    idno = item.get("series_description", {}).get("idno")
+                    if idno:
+                        metadata[idno] = item
+        return metadata
+    
+    def _coalesce(self, kind: str, url: str, params: Dict, fetch) -> Any:
+        """Run fetch(url, params) once for concurrent identical requests, sharing its result"""
+        key = (kind, url, tuple(sorted(params.items())))
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        
+        if not leader:
+            return future.result()
+        
+        try:
+            future.set_result(fetch(url, params))
+        except BaseException as exc:
+            future.set_exception(exc)
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+        return future.result()
+    
+    def _get_json(self, url: str, params: Dict) -> Any:
+        """GET and decode a JSON response, sharing in-flight duplicates"""
+        return self._coalesce("json", url, params, self._fetch_json)
+    
+    def _fetch_json(self, url: str, params: Dict) -> Any:
+        """GET and decode a JSON response, revalidating previously seen resources"""
+        key = (url, tuple(sorted(params.items())))
+        with self._validators_lock:
+            cached = self._validators.get(key)
+            if cached:
+                self._validators.move_to_end(key)
+        
+        headers = {}
+        if cached:
+            etag, last_modified, _ = cached
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+        
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        if response.status_code == 304 and cached:
+            return json_loads(cached[2])
+        response.raise_for_status()
+        
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            with self._validators_lock:
+                self._validators[key] = (etag, last_modified, response.content)
+                self._validators.move_to_end(key)
+                if len(self._validators) > self.VALIDATOR_CACHE_SIZE:
+                    self._validators.popitem(last=False)
+        return json_loads(response.content)
+    
+    def _get_data_page(self, url: str, params: Dict) -> Dict:
+        """GET a data page, sharing in-flight duplicates"""
+        if ijson is None:
+            return self._get_json(url, params)
+        return self._coalesce("data", url, params, self._fetch_data_page)
+    
+    def _fetch_data_page(self, url: str, params: Dict) -> Dict:
+        """GET a data page, parsing large bodies incrementally as they arrive (requires ijson)"""
+        with self.session.get(url, params=params, stream=True, timeout=self.timeout) as response:
+            response.raise_for_status()
+            length = response.headers.get("Content-Length")
+            if length is not None and int(length) < self.STREAM_THRESHOLD:
+                return json_loads(response.content)
+            
+            response.raw.decode_content = True
+            try:
+                return dict(ijson.kvitems(response.raw, "", use_float=True))
+            except (Urllib3HTTPError, ijson.JSONError) as e:
+                # Reading response.raw bypasses requests' own wrapping of mid-body failures
+                raise requests.RequestException(f"Incomplete data page from {url}: {e}") from e
+    
+    def _post_json(self, url: str, payload: Dict) -> Any:
+        """POST a JSON body and decode the JSON response"""
+        response = self.session.post(url, data=json_dumps(payload),
+                                     headers={"Content-Type": "application/json"}, timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
     
     def get_data(self, database_id: str, indicator: Optional[str] = None, 
                  ref_area: Optional[str] = None, time_period_from: Optional[str] = None,
                  time_period_to: Optional[str] = None, auto_paginate: bool = True,
-                 max_records: int = 10000) -> Dict:
-        """Fetch data with optional auto-pagination"""
+                 max_records: int = 10000, columnar: bool = False) -> Dict:
+        """Fetch data with optional auto-pagination
+        
+        With columnar=True the records are returned as a column dict under
+        "columns" instead of a list of row dicts under "value".
+        """
         url = f"{self.BASE_URL}/data360/data"
         params = {"DATABASE_ID": database_id}
         
@@ -95,40 +314,217 @@ class Data360Client:
             params["timePeriodTo"] = time_period_to
             
         if not auto_paginate:
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url, params)
         
-        all_data = []
-        skip = 0
-        total_count = None
+        # The first page reports the total, so the remaining offsets can be fetched concurrently
+        first = self._get_data_page(url, {**params, "skip": 0})
+        total_count = first.get("count", 0)
+        first_page = first.get("value", [])
+        page_size = len(first_page)
+        all_data = first_page[:max_records]
         
-        while len(all_data) < max_records:
-            params["skip"] = skip
-            response = self.session.get(url, params=params, timeout=self.timeout)
-            response.raise_for_status()
-            result = response.json()
-            
-            if total_count is None:
-                total_count = result.get("count", 0)
-            
-            batch_data = result.get("value", [])
-            if not batch_data:
-                break
-                
-            all_data.extend(batch_data)
-            
-            if len(all_data) >= total_count or len(all_data) >= max_records:
-                break
-                
-            skip += len(batch_data)
-            time.sleep(0.05)
+        # Pages are trimmed as they are appended, so the list never grows past max_records
+        skips = range(page_size, min(total_count, max_records), page_size) if page_size else range(0)
+        if skips:
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(skips))) as executor:
+                pages = executor.map(lambda skip: self._get_data_page(url, {**params, "skip": skip}), skips)
+                for page in pages:
+                    all_data.extend(page.get("value", [])[:max_records - len(all_data)])
+        
+        if columnar:
+            return {
+                "count": len(all_data),
+                "total_count": total_count,
+                "columns": self._records_to_columns(all_data)
+            }
         
         return {
             "count": len(all_data),
             "total_count": total_count,
-            "value": all_data[:max_records]
+            "value": all_data
         }
+    
+    def get_data_multi(self, database_id: str, indicator: Optional[str], ref_areas: Sequence[str],
+                       time_period_from: Optional[str] = None, time_period_to: Optional[str] = None,
+                       max_records_per_area: int = 5000) -> Dict:
+        """Fetch several countries in one paginated query, grouped by country in ref_areas order
+        
+        Countries missing from the combined result (or all of them, if the server
+        rejects the combined REF_AREA list) are re-fetched with one concurrent
+        request each, as are countries short of their quota when the combined
+        result was cut off. If any of those fail, PartialDataError carries the rest.
+        """
+        records = []
+        truncated = False
+        try:
+            combined = self.get_data(database_id, indicator=indicator, ref_area=",".join(ref_areas),
+                                     time_period_from=time_period_from, time_period_to=time_period_to,
+                                     max_records=max_records_per_area * len(ref_areas))
+            records = combined["value"]
+            truncated = combined["total_count"] > len(records)
+        except requests.HTTPError as e:
+            if e.response is None or e.response.status_code != 400:
+                raise
+        
+        by_area = defaultdict(list)
+        for record in records:
+            by_area[record.get("REF_AREA")].append(record)
+        
+        # A cut-off combined result may hold only part of any country that didn't fill its quota
+        refetch = [area for area in ref_areas
+                   if area not in by_area or (truncated and len(by_area[area]) < max_records_per_area)]
+        failed = []
+        if refetch:
+            def fetch_area(area: str) -> List[Dict]:
+                return self.get_data(database_id, indicator=indicator, ref_area=area,
+                                     time_period_from=time_period_from, time_period_to=time_period_to,
+                                     max_records=max_records_per_area)["value"]
+            
+            with ThreadPoolExecutor(max_workers=min(self.MAX_WORKERS, len(refetch))) as executor:
+                futures = {executor.submit(fetch_area, area): area for area in refetch}
+                for future in as_completed(futures):
+                    area = futures[future]
+                    try:
+                        by_area[area] = future.result()
+                    except (requests.RequestException, ValueError) as e:
+                        logger.warning("Data fetch failed for %s/%s/%s: %s", database_id, indicator, area, e)
+                        by_area.pop(area, None)
+                        failed.append(area)
+        
+        value = [record for area in ref_areas for record in by_area.get(area, [])[:max_records_per_area]]
+        data = {"count": len(value), "value": value}
+        if failed:
+            raise PartialDataError(data, [area for area in ref_areas if area in failed])
+        return data
+    
+    @staticmethod
+    def _records_to_columns(records: List[Dict]) -> Dict[str, List]:
+        """Transpose row dicts into one list per field"""
+        fields = dict.fromkeys(key for row in records for key in row)
+        return {field: [row.get(field) for row in records] for field in fields}
+    
+    @staticmethod
+    def to_dataframe(result: Dict) -> pd.DataFrame:
+        """Build a DataFrame from a get_data result in either layout"""
+        if "columns" in result:
+            return pd.DataFrame(result["columns"], copy=False)
+        return pd.DataFrame(result.get("value", []))
+
+
+# ============================================================================
+# CACHED API CALLS
+# ============================================================================
+
+@st.cache_resource
+def get_client() -> Data360Client:
+    """Process-wide client so the HTTP session is shared across reruns and users"""
+    return Data360Client()
+
+
+# Catalog payloads are persisted under ~/.streamlit/cache so they survive restarts.
+# Bump CACHE_VERSION to invalidate them. Streamlit ignores ttl for persisted caches,
+# so expiry is driven by a time bucket passed as part of the cache key instead, and
+# each function's cache is cleared when its bucket rolls over so superseded pickles
+# don't pile up on disk. Per-day data uses an in-memory ttl instead.
+CACHE_VERSION = 1
+DAY = 86400
+EPOCH_FILE = Path.home() / ".streamlit" / "cache" / "world_data_bank_epochs.json"
+_epoch_lock = threading.Lock()
+_epochs: Dict[str, List[int]] = {}
+
+
+def cache_epoch(cached_fn, ttl_seconds: int) -> Tuple[int, int]:
+    """Cache-key argument that changes with CACHE_VERSION and every ttl_seconds, clearing cached_fn on rollover"""
+    epoch = (CACHE_VERSION, int(time.time() // ttl_seconds))
+    name = cached_fn.__name__
+    if tuple(_epochs.get(name, ())) == epoch:
+        return epoch
+    with _epoch_lock:
+        if not _epochs:
+            try:
+                _epochs.update(json.loads(EPOCH_FILE.read_text()))
+            except (OSError, ValueError):
+                pass
+        if tuple(_epochs.get(name, ())) != epoch:
+            # A different (or unknown) stored epoch means any pickles on disk are superseded
+            cached_fn.clear()
+            _epochs[name] = list(epoch)
+            try:
+                EPOCH_FILE.parent.mkdir(parents=True, exist_ok=True)
+                EPOCH_FILE.write_text(json.dumps(_epochs))
+            except OSError as e:
+                logger.warning("Could not record cache epochs: %s", e)
+    return epoch
+
+
+@st.cache_data(ttl=DAY, max_entries=1024, show_spinner=False)
+def _api_search(_client: Data360Client, query: str, top: int, skip: int, filter_by: Optional[str],
+                orderby: Optional[str], fields: Tuple[str, ...]) -> Dict:
+    return _client.search(query, top=top, skip=skip, filter_by=filter_by, orderby=orderby,
+                          fields=fields, raise_errors=True)
+
+
+def api_search(client: Data360Client, query: str, top: int = 100, skip: int = 0,
+               filter_by: Optional[str] = None, orderby: Optional[str] = None,
+               fields: Sequence[str] = FULL_FIELDS) -> Dict:
+    """Cached search (1 day); failed searches are not cached"""
+    try:
+        return _api_search(client, query, top, skip, filter_by, orderby, tuple(fields))
+    except Exception as e:
+        logger.warning("Search failed for %r: %s", query, e)
+        return {"value": [], "@odata.count": 0}
+
+
+@st.cache_data(persist="disk", max_entries=8192, show_spinner=False)
+def _api_list_indicators(_client: Data360Client, database_id: str, epoch: Tuple[int, int]) -> List[str]:
+    return _client.list_indicators(database_id)
+
+
+def api_list_indicators(client: Data360Client, database_id: str) -> List[str]:
+    """Cached indicator listing (7 days on disk)"""
+    return _api_list_indicators(client, database_id, cache_epoch(_api_list_indicators, 7 * DAY))
+
+
+@st.cache_data(persist="disk", max_entries=8192, show_spinner=False)
+def _api_indicator_metadata(_client: Data360Client, indicator_id: str, epoch: Tuple[int, int]) -> Dict:
+    return _client.get_indicator_metadata(indicator_id)
+
+
+def api_indicator_metadata(client: Data360Client, indicator_id: str) -> Dict:
+    """Cached indicator metadata (7 days on disk)"""
+    return _api_indicator_metadata(client, indicator_id, cache_epoch(_api_indicator_metadata, 7 * DAY))
+
+
+@st.cache_data(persist="disk", max_entries=8192, show_spinner=False)
+def _api_indicators_metadata(_client: Data360Client, indicator_ids: Tuple[str, ...],
+                             epoch: Tuple[int, int]) -> Dict[str, Dict]:
+    return _client.get_indicators_metadata(list(indicator_ids))
+
+
+def api_indicators_metadata(client: Data360Client, indicator_ids: Tuple[str, ...]) -> Dict[str, Dict]:
+    """Cached batched indicator metadata (7 days on disk)"""
+    return _api_indicators_metadata(client, indicator_ids, cache_epoch(_api_indicators_metadata, 7 * DAY))
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def api_get_data(_client: Data360Client, database_id: str, indicator: Optional[str] = None,
+                 ref_area: Optional[str] = None, time_period_from: Optional[str] = None,
+                 time_period_to: Optional[str] = None, auto_paginate: bool = True,
+                 max_records: int = 10000, columnar: bool = False) -> Dict:
+    """Cached data fetch"""
+    return _client.get_data(database_id, indicator=indicator, ref_area=ref_area,
+                            time_period_from=time_period_from, time_period_to=time_period_to,
+                            auto_paginate=auto_paginate, max_records=max_records,
+                            columnar=columnar)
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def api_get_data_multi(_client: Data360Client, database_id: str, indicator: Optional[str],
+                       ref_areas: Tuple[str, ...], time_period_from: Optional[str] = None,
+                       time_period_to: Optional[str] = None, max_records_per_area: int = 5000) -> Dict:
+    """Cached multi-country data fetch"""
+    return _client.get_data_multi(database_id, indicator, ref_areas, time_period_from=time_period_from,
+                                  time_period_to=time_period_to, max_records_per_area=max_records_per_area)
 
 
 # ============================================================================
@@ -216,24 +612,26 @@ ABBREVIATION_DECODER = {
 }
 
 
+_ABBREV_LOWER = {abbrev.lower(): name for abbrev, name in ABBREVIATION_DECODER.items()}
+
+# Matches a whole "_"-delimited part that is a known abbreviation
+_ABBREV_RE = re.compile(
+    r"(?<![^_])(" + "|".join(map(re.escape, sorted(ABBREVIATION_DECODER, key=len, reverse=True))) + r")(?![^_])",
+    re.IGNORECASE
+)
+
+
+@lru_cache(maxsize=16384)
 def decode_indicator_name(indicator_id: str, raw_name: str = None) -> str:
     """Decode cryptic indicator IDs into readable names"""
     if raw_name and len(raw_name) > 20 and not raw_name.isupper():
         return raw_name
     
-    parts = indicator_id.split("_")
-    
-    meaningful_parts = []
-    for i, part in enumerate(parts):
-        if i < 2:
-            continue
-        
-        decoded = ABBREVIATION_DECODER.get(part.upper(), part)
-        meaningful_parts.append(decoded)
+    parts = indicator_id.split("_", 2)
     
-    if meaningful_parts:
-        decoded_name = " - ".join(meaningful_parts)
-        return decoded_name
+    if len(parts) > 2:
+        decoded = _ABBREV_RE.sub(lambda m: _ABBREV_LOWER[m.group(1).lower()], parts[2])
+        return decoded.replace("_", " - ")
     
     return raw_name or indicator_id.replace("_", " ").title()
 
@@ -242,617 +640,796 @@ def decode_indicator_name(indicator_id: str, raw_name: str = None) -> str:
 # DATABASE CATALOG
 # ============================================================================
 
-DATABASE_CATALOG = {
-    "BS_BTI": {
-        "name": "Bertelsmann Transformation Index",
-        "organization": "Bertelsmann Stiftung",
-        "themes": ["Governance", "Democracy", "Development"],
-        "description": "Political and economic transformation in developing countries",
-        "indicator_count": 76
-    },
-    "BS_SGI": {
-        "name": "Sustainable Governance Indicators",
-        "organization": "Bertelsmann Stiftung",
-        "themes": ["Governance", "Sustainability", "Policy"],
-        "description": "Quality of governance in OECD countries",
-        "indicator_count": 193
-    },
-    "FAO_AS": {
-        "name": "Agriculture Statistics",
-        "organization": "FAO",
-        "themes": ["Agriculture", "Food Security", "Environment"],
-        "description": "Agricultural production, trade, and food security indicators",
-        "indicator_count": 124
-    },
-    "FH_FIW": {
-        "name": "Freedom in the World",
-        "organization": "Freedom House",
-        "themes": ["Governance", "Democracy", "Civil Liberties"],
-        "description": "Political rights and civil liberties assessments",
-        "indicator_count": 38
-    },
-    "GEM_APS": {
-        "name": "Adult Population Survey",
-        "organization": "Global Entrepreneurship Monitor",
-        "themes": ["Entrepreneurship", "Business", "Innovation"],
-        "description": "Entrepreneurial activity and attitudes",
-        "indicator_count": 15
-    },
-    "GEM_NES": {
-        "name": "National Expert Survey",
-        "organization": "Global Entrepreneurship Monitor",
-        "themes": ["Entrepreneurship", "Business"],
-        "description": "Expert assessments of entrepreneurship conditions",
-        "indicator_count": 12
-    },
-    "GI_AII": {
-        "name": "Global Innovation Index",
-        "organization": "Global Innovation Index",
-        "themes": ["Innovation", "Technology", "Economy"],
-        "description": "Innovation capabilities and results across countries",
-        "indicator_count": 114
-    },
-    "IDB_INFRALATAM": {
-        "name": "InfraLatam",
-        "organization": "Inter-American Development Bank",
-        "themes": ["Infrastructure", "Transportation", "Energy"],
-        "description": "Infrastructure investment in Latin America",
-        "indicator_count": 3
-    },
-    "IFC_GB": {
-        "name": "Global Business Environment",
-        "organization": "IFC",
-        "themes": ["Business", "Economy", "Regulation"],
-        "description": "Business environment and regulatory quality",
-        "indicator_count": 1
-    },
-    "ILO_EMP": {
-        "name": "Employment Statistics",
-        "organization": "ILO",
-        "themes": ["Employment", "Labor", "Economy"],
-        "description": "Labor market statistics including employment, unemployment, and wages",
-        "indicator_count": 6
-    },
-    "IMF_BOP": {
-        "name": "Balance of Payments",
-        "organization": "IMF",
-        "themes": ["Trade", "Finance", "Current Account"],
-        "description": "International transactions including trade balance and capital flows",
-        "indicator_count": 5209
-    },
-    "IMF_BOPAGG": {
-        "name": "Balance of Payments Aggregates",
-        "organization": "IMF",
-        "themes": ["Trade", "Finance"],
-        "description": "Aggregated balance of payments statistics",
-        "indicator_count": 38
-    },
-    "IMF_CDIR": {
-        "name": "Coordinated Direct Investment",
-        "organization": "IMF",
-        "themes": ["Economy", "Finance", "Investment"],
-        "description": "Direct investment positions by country",
-        "indicator_count": 4
-    },
-    "IMF_CDIS": {
-        "name": "Coordinated Direct Investment Survey",
-        "organization": "IMF",
-        "themes": ["Economy", "Finance", "Investment"],
-        "description": "Direct investment survey data",
-        "indicator_count": 20
-    },
-    "IMF_CPIS": {
-        "name": "Coordinated Portfolio Investment Survey",
-        "organization": "IMF",
-        "themes": ["Economy", "Finance", "Investment"],
-        "description": "Portfolio investment holdings by country",
-        "indicator_count": 50
-    },
-    "IMF_ET": {
-        "name": "Exchange Rates",
-        "organization": "IMF",
-        "themes": ["Economy", "Finance", "Currency"],
-        "description": "Exchange rate data and currency statistics",
-        "indicator_count": 5
-    },
-    "IMF_FAS": {
-        "name": "Financial Access Survey",
-        "organization": "IMF",
-        "themes": ["Finance", "Financial Inclusion"],
-        "description": "Financial access and inclusion indicators",
-        "indicator_count": 82
-    },
-    "IMF_FFS": {
-        "name": "Financial Fragility Survey",
-        "organization": "IMF",
-        "themes": ["Finance", "Financial Stability"],
-        "description": "Financial fragility and stability metrics",
-        "indicator_count": 21
-    },
-    "IMF_FISCALDECENTRALIZATION": {
-        "name": "Fiscal Decentralization",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government", "Public Finance"],
-        "description": "Fiscal decentralization indicators",
-        "indicator_count": 36
-    },
-    "IMF_FSI": {
-        "name": "Financial Soundness Indicators",
-        "organization": "IMF",
-        "themes": ["Finance", "Banking", "Financial Stability"],
-        "description": "Banking sector health and stability indicators",
-        "indicator_count": 593
-    },
-    "IMF_FSIRE": {
-        "name": "FSI Regulatory",
-        "organization": "IMF",
-        "themes": ["Finance", "Banking", "Regulation"],
-        "description": "Financial soundness regulatory indicators",
-        "indicator_count": 21
-    },
-    "IMF_GFSCOFOG": {
-        "name": "Government Finance - COFOG",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government"],
-        "description": "Government expenditure by function",
-        "indicator_count": 80
-    },
-    "IMF_GFSE": {
-        "name": "Government Finance Statistics",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government", "Public Finance"],
-        "description": "Government revenue, expenditure, and debt",
-        "indicator_count": 48
-    },
-    "IMF_GFSIBS": {
-        "name": "GFS Integrated Balance Sheet",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government"],
-        "description": "Government balance sheet data",
-        "indicator_count": 15
-    },
-    "IMF_GFSMAB": {
-        "name": "GFS Main Aggregates",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government"],
-        "description": "Main government finance aggregates",
-        "indicator_count": 70
-    },
-    "IMF_GFSR": {
-        "name": "Global Financial Stability Report",
-        "organization": "IMF",
-        "themes": ["Finance", "Financial Stability"],
-        "description": "Global financial stability assessments",
-        "indicator_count": 84
-    },
-    "IMF_GFSSSUC": {
-        "name": "GFS Summary",
-        "organization": "IMF",
-        "themes": ["Fiscal", "Government"],
-        "description": "Summary government finance statistics",
-        "indicator_count": 26
-    },
-    "IMF_IRFCL": {
-        "name": "International Reserves and Foreign Currency",
-        "organization": "IMF",
-        "themes": ["Finance", "Reserves", "Currency"],
-        "description": "International reserves and liquidity data",
-        "indicator_count": 120
-    },
-    "IMF_PCTOT": {
-        "name": "Primary Commodity Prices",
-        "organization": "IMF",
-        "themes": ["Economy", "Commodities", "Prices"],
-        "description": "Primary commodity price indices",
-        "indicator_count": 6
-    },
-    "IMF_WEO": {
-        "name": "World Economic Outlook",
-        "organization": "IMF",
-        "themes": ["Economy", "GDP", "Fiscal Policy", "Forecasts"],
-        "description": "Macroeconomic indicators and projections for 190+ countries",
-        "indicator_count": 44
-    },
-    "ITU_DH": {
-        "name": "Digital Health",
-        "organization": "ITU",
-        "themes": ["Health", "Technology", "Digital"],
-        "description": "Digital health technology indicators",
-        "indicator_count": 39
-    },
-    "ITU_GCI": {
-        "name": "ICT Development Index",
-        "organization": "ITU",
-        "themes": ["Technology", "Telecommunications", "Innovation"],
-        "description": "ICT development and infrastructure",
-        "indicator_count": 26
-    },
-    "ITU_ICT": {
-        "name": "ICT Indicators",
-        "organization": "ITU",
-        "themes": ["Technology", "Telecommunications", "Digital"],
-        "description": "Information and communication technology adoption and access",
-        "indicator_count": 10
-    },
-    "JRC_EDGAR": {
-        "name": "Emissions Database",
-        "organization": "Joint Research Centre",
-        "themes": ["Environment", "Climate", "Emissions"],
-        "description": "Greenhouse gas emissions by country and sector",
-        "indicator_count": 10
-    },
-    "OECDWBG_PMR": {
-        "name": "Product Market Regulation",
-        "organization": "OECD",
-        "themes": ["Economy", "Regulation", "Business"],
-        "description": "Product market regulation indicators",
-        "indicator_count": 33
-    },
-    "OECD_BROADBAND": {
-        "name": "Broadband Statistics",
-        "organization": "OECD",
-        "themes": ["Technology", "Telecommunications", "Infrastructure"],
-        "description": "Broadband penetration and quality metrics",
-        "indicator_count": 11
-    },
-    "OECD_IDD": {
-        "name": "International Development Database",
-        "organization": "OECD",
-        "themes": ["Development", "Aid", "Finance"],
-        "description": "Official development assistance and aid flows",
-        "indicator_count": 53
-    },
-    "OECD_TIVA": {
-        "name": "Trade in Value Added",
-        "organization": "OECD",
-        "themes": ["Trade", "Economy", "Value Chains"],
-        "description": "Global value chain participation and trade in value added",
-        "indicator_count": 24
-    },
-    "OWID_CB": {
-        "name": "Our World in Data",
-        "organization": "Our World in Data",
-        "themes": ["Research", "Development", "Multiple"],
-        "description": "Research-based development indicators across multiple topics",
-        "indicator_count": 76
-    },
-    "POLITY5_PRC": {
-        "name": "Polity5 Political Regime",
-        "organization": "Center for Systemic Peace",
-        "themes": ["Governance", "Political Systems", "Democracy"],
-        "description": "Political regime characteristics and transitions",
-        "indicator_count": 14
-    },
-    "RWB_PFI": {
-        "name": "Press Freedom Index",
-        "organization": "Reporters Without Borders",
-        "themes": ["Governance", "Media", "Freedom"],
-        "description": "Press freedom and journalist safety",
-        "indicator_count": 12
-    },
-    "UIS_EDSTATS": {
-        "name": "UNESCO Education Statistics",
-        "organization": "UNESCO Institute for Statistics",
-        "themes": ["Education", "Literacy", "Skills"],
-        "description": "Detailed education statistics from pre-primary to tertiary",
-        "indicator_count": 41
-    },
-    "UNCTAD_DE": {
-        "name": "Development Economics",
-        "organization": "UNCTAD",
-        "themes": ["Economy", "Development", "Trade"],
-        "description": "Economic development and trade indicators",
-        "indicator_count": 14
-    },
-    "UNCTAD_MT": {
-        "name": "Maritime Transport",
-        "organization": "UNCTAD",
-        "themes": ["Trade", "Transportation", "Logistics"],
-        "description": "Maritime transport and port statistics",
-        "indicator_count": 9
-    },
-    "UNDRR_SFM": {
-        "name": "Sendai Framework Monitor",
-        "organization": "UN Office for Disaster Risk Reduction",
-        "themes": ["Environment", "Disaster Risk", "Resilience"],
-        "description": "Disaster risk reduction indicators",
-        "indicator_count": 36
-    },
-    "UNESCO_UIS": {
-        "name": "UNESCO Institute for Statistics",
-        "organization": "UNESCO",
-        "themes": ["Education", "Science", "Culture", "Communication"],
-        "description": "Education, science, culture and communication statistics",
-        "indicator_count": 2
-    },
-    "UNICEF_DW": {
-        "name": "UNICEF Data Warehouse",
-        "organization": "UNICEF",
-        "themes": ["Health", "Education", "Child Welfare", "Nutrition"],
-        "description": "Child-focused development indicators covering health, education, and protection",
-        "indicator_count": 16
-    },
-    "UNSD_EI": {
-        "name": "Environment Indicators",
-        "organization": "UN Statistics Division",
-        "themes": ["Environment", "Sustainability"],
-        "description": "Environmental and sustainability indicators",
-        "indicator_count": 20
-    },
-    "VDEM_CORE": {
-        "name": "Varieties of Democracy",
-        "organization": "V-Dem Institute",
-        "themes": ["Governance", "Democracy", "Political Rights"],
-        "description": "Comprehensive democracy indicators covering electoral, liberal, participatory, deliberative, and egalitarian principles",
-        "indicator_count": 84
-    },
-    "WB_BID": {
-        "name": "Business Intelligence Dashboard",
-        "organization": "World Bank",
-        "themes": ["Business", "Economy"],
-        "description": "Business intelligence indicators",
-        "indicator_count": 4
-    },
-    "WB_BOOST": {
-        "name": "BOOST Public Expenditure",
-        "organization": "World Bank",
-        "themes": ["Fiscal", "Government", "Public Finance"],
-        "description": "Government expenditure data by sector and economic classification",
-        "indicator_count": 232
-    },
-    "WB_BPS": {
-        "name": "Business Pulse Survey",
-        "organization": "World Bank",
-        "themes": ["Business", "Economy", "COVID-19"],
-        "description": "Business impacts from COVID-19 pandemic",
-        "indicator_count": 28
-    },
-    "WB_BREADY": {
-        "name": "Business Ready",
-        "organization": "World Bank",
-        "themes": ["Business", "Regulation"],
-        "description": "Business regulatory environment indicators",
-        "indicator_count": 3
-    },
-    "WB_CCDFS": {
-        "name": "Climate Change Data and Finance",
-        "organization": "World Bank",
-        "themes": ["Climate", "Environment", "Finance"],
-        "description": "Climate change and finance data",
-        "indicator_count": 23
-    },
-    "WB_CCKP": {
-        "name": "Climate Change Knowledge Portal",
-        "organization": "World Bank",
-        "themes": ["Climate", "Environment"],
-        "description": "Climate change projections and historical data",
-        "indicator_count": 40
-    },
-    "WB_CLEAR": {
-        "name": "Country Learning and Evaluation",
-        "organization": "World Bank",
-        "themes": ["Development", "Evaluation"],
-        "description": "Country learning and evaluation indicators",
-        "indicator_count": 93
-    },
-    "WB_CPIA": {
-        "name": "Country Policy and Institutional Assessment",
-        "organization": "World Bank",
-        "themes": ["Governance", "Policy", "Institutions"],
-        "description": "Policy and institutional quality assessments",
-        "indicator_count": 21
-    },
-    "WB_CSC": {
-        "name": "Country Statistical Capacity",
-        "organization": "World Bank",
-        "themes": ["Statistics", "Data Quality"],
-        "description": "Statistical capacity indicators",
-        "indicator_count": 64
-    },
-    "WB_EDSTATS": {
-        "name": "Education Statistics",
-        "organization": "World Bank",
-        "themes": ["Education", "Enrollment", "Literacy"],
-        "description": "Comprehensive education statistics including enrollment, completion, and learning outcomes",
-        "indicator_count": 1071
-    },
-    "WB_EQOSOGI": {
-        "name": "Equity of Opportunity",
-        "organization": "World Bank",
-        "themes": ["Social", "Equality", "Opportunity"],
-        "description": "Equity and opportunity indicators",
-        "indicator_count": 6
-    },
-    "WB_ES": {
-        "name": "Enterprise Surveys",
-        "organization": "World Bank",
-        "themes": ["Business", "Economy", "Investment"],
-        "description": "Firm-level business environment data",
-        "indicator_count": 540
-    },
-    "WB_ESG": {
-        "name": "ESG Data",
-        "organization": "World Bank",
-        "themes": ["Environment", "Social", "Governance"],
-        "description": "Environmental, social, and governance indicators",
-        "indicator_count": 71
-    },
-    "WB_EWSA": {
-        "name": "Early Warning System",
-        "organization": "World Bank",
-        "themes": ["Economy", "Crisis", "Risk"],
-        "description": "Economic crisis early warning indicators",
-        "indicator_count": 29
-    },
-    "WB_FINDEX": {
-        "name": "Global Findex Database",
-        "organization": "World Bank",
-        "themes": ["Finance", "Financial Inclusion"],
-        "description": "Financial inclusion data covering account ownership, payments, savings, and credit",
-        "indicator_count": 280
-    },
-    "WB_FSI": {
-        "name": "Financial Sector Indicators",
-        "organization": "World Bank",
-        "themes": ["Finance", "Banking"],
-        "description": "Financial sector development indicators",
-        "indicator_count": 63
-    },
-    "WB_GIRG": {
-        "name": "Global Identification Challenge",
-        "organization": "World Bank",
-        "themes": ["Digital ID", "Governance"],
-        "description": "Data on identification systems and coverage",
-        "indicator_count": 6
-    },
-    "WB_GS": {
-        "name": "Gender Statistics",
-        "organization": "World Bank",
-        "themes": ["Gender", "Social", "Equality"],
-        "description": "Gender-disaggregated data across demographics, education, health, and economy",
-        "indicator_count": 363
-    },
-    "WB_GTMI": {
-        "name": "Global Trade Monitoring",
-        "organization": "World Bank",
-        "themes": ["Trade", "Economy"],
-        "description": "Global trade monitoring indicators",
-        "indicator_count": 58
-    },
-    "WB_HCP": {
-        "name": "Human Capital Project",
-        "organization": "World Bank",
-        "themes": ["Human Capital", "Education", "Health"],
-        "description": "Human capital development indicators",
-        "indicator_count": 133
-    },
-    "WB_HNP": {
-        "name": "Health Nutrition and Population",
-        "organization": "World Bank",
-        "themes": ["Health", "Nutrition", "Demographics"],
-        "description": "Health system performance, disease prevalence, and demographic indicators",
-        "indicator_count": 221
-    },
-    "WB_LPI": {
-        "name": "Logistics Performance Index",
-        "organization": "World Bank",
-        "themes": ["Trade", "Logistics", "Infrastructure"],
-        "description": "Logistics and supply chain performance",
-        "indicator_count": 18
-    },
-    "WB_MPO": {
-        "name": "Macro Poverty Outlook",
-        "organization": "World Bank",
-        "themes": ["Poverty", "Economy", "Forecasts"],
-        "description": "Poverty and economic outlook projections",
-        "indicator_count": 103
-    },
-    "WB_RISE": {
-        "name": "Regulatory Indicators for Sustainable Energy",
-        "organization": "World Bank",
-        "themes": ["Energy", "Regulation", "Sustainability"],
-        "description": "Sustainable energy regulatory framework",
-        "indicator_count": 38
-    },
-    "WB_SPI": {
-        "name": "Statistical Performance Indicators",
-        "organization": "World Bank",
-        "themes": ["Statistics", "Data Quality"],
-        "description": "Statistical performance and capacity indicators",
-        "indicator_count": 71
-    },
-    "WB_SSGD": {
-        "name": "Subnational Statistics on Gender",
-        "organization": "World Bank",
-        "themes": ["Gender", "Social", "Subnational"],
-        "description": "Subnational gender statistics",
-        "indicator_count": 128
-    },
-    "WB_THINK_HAZARD": {
-        "name": "ThinkHazard",
-        "organization": "World Bank",
-        "themes": ["Environment", "Disaster Risk", "Hazards"],
-        "description": "Natural hazard risk information",
-        "indicator_count": 11
-    },
-    "WB_WBL": {
-        "name": "Women Business and the Law",
-        "organization": "World Bank",
-        "themes": ["Gender", "Business", "Legal Rights"],
-        "description": "Gender equality in business and legal rights",
-        "indicator_count": 49
-    },
-    "WB_WDI": {
-        "name": "World Development Indicators",
-        "organization": "World Bank",
-        "themes": ["Economy", "Demographics", "Education", "Health", "Environment", "Infrastructure"],
-        "description": "Primary World Bank database with 1500+ indicators covering all aspects of development",
-        "indicator_count": 1508
-    },
-    "WB_WGI": {
-        "name": "Worldwide Governance Indicators",
-        "organization": "World Bank",
-        "themes": ["Governance", "Political Stability", "Rule of Law"],
-        "description": "Governance quality indicators across 200+ countries since 1996",
-        "indicator_count": 36
-    },
-    "WB_WITS": {
-        "name": "World Integrated Trade Solution",
-        "organization": "World Bank",
-        "themes": ["Trade", "Economy", "Tariffs"],
-        "description": "International trade statistics, tariffs, and trade agreements",
-        "indicator_count": 44
-    },
-    "WB_WWBI": {
-        "name": "Worldwide Bureaucracy Indicators",
-        "organization": "World Bank",
-        "themes": ["Governance", "Public Sector"],
-        "description": "Public sector workforce and bureaucracy indicators",
-        "indicator_count": 37
-    },
-    "WEF_GCI": {
-        "name": "Global Competitiveness Index",
-        "organization": "World Economic Forum",
-        "themes": ["Economy", "Competitiveness", "Innovation", "Infrastructure"],
-        "description": "National competitiveness across 12 pillars including innovation and institutions",
-        "indicator_count": 169
-    },
-    "WEF_GCIHH": {
-        "name": "Global Competitiveness Index (Historical)",
-        "organization": "World Economic Forum",
-        "themes": ["Economy", "Competitiveness", "Innovation"],
-        "description": "Historical global competitiveness data",
-        "indicator_count": 163
-    },
-    "WEF_TTDI": {
-        "name": "Travel & Tourism Development Index",
-        "organization": "World Economic Forum",
-        "themes": ["Tourism", "Economy", "Infrastructure"],
-        "description": "Tourism competitiveness and development",
-        "indicator_count": 140
-    },
-    "WI_GRT": {
-        "name": "Global Inequality Database",
-        "organization": "World Inequality Database",
-        "themes": ["Social", "Inequality", "Income"],
-        "description": "Income and wealth inequality data",
-        "indicator_count": 4
-    },
-    "WJP_ROL": {
-        "name": "Rule of Law Index",
-        "organization": "World Justice Project",
-        "themes": ["Governance", "Justice", "Rule of Law"],
-        "description": "Rule of law performance across multiple dimensions",
-        "indicator_count": 53
-    },
-    "WRI_CLIMATEWATCH": {
-        "name": "Climate Watch",
-        "organization": "World Resources Institute",
-        "themes": ["Climate", "Environment", "Policy"],
-        "description": "Climate change data and policy tracking",
-        "indicator_count": 2
-    },
-}
+class DatasetMeta(NamedTuple):
+    """One catalog entry"""
+    name: str
+    organization: str
+    themes: Tuple[str, ...]
+    description: str
+    indicator_count: int
+
+
+# Cached functions store these as plain tuples: pickling a class defined in the
+# __main__ script fails once a rerun has replaced that module.
+class IndicatorMeta(NamedTuple):
+    """One indicator, as listed or searched"""
+    id: str
+    name: str
+    description: str
+    topics: Tuple[str, ...]
+    database_id: str
+    source: Dict
+
+
+@st.cache_resource(show_spinner=False)
+def load_database_catalog() -> types.MappingProxyType:
+    """Database catalog, built once per process and shared by every session and rerun"""
+    catalog = {
+        "BS_BTI": DatasetMeta(
+            name="Bertelsmann Transformation Index",
+            organization="Bertelsmann Stiftung",
+            themes=("Governance", "Democracy", "Development"),
+            description="Political and economic transformation in developing countries",
+            indicator_count=76
+        ),
+        "BS_SGI": DatasetMeta(
+            name="Sustainable Governance Indicators",
+            organization="Bertelsmann Stiftung",
+            themes=("Governance", "Sustainability", "Policy"),
+            description="Quality of governance in OECD countries",
+            indicator_count=193
+        ),
+        "FAO_AS": DatasetMeta(
+            name="Agriculture Statistics",
+            organization="FAO",
+            themes=("Agriculture", "Food Security", "Environment"),
+            description="Agricultural production, trade, and food security indicators",
+            indicator_count=124
+        ),
+        "FH_FIW": DatasetMeta(
+            name="Freedom in the World",
+            organization="Freedom House",
+            themes=("Governance", "Democracy", "Civil Liberties"),
+            description="Political rights and civil liberties assessments",
+            indicator_count=38
+        ),
+        "GEM_APS": DatasetMeta(
+            name="Adult Population Survey",
+            organization="Global Entrepreneurship Monitor",
+            themes=("Entrepreneurship", "Business", "Innovation"),
+            description="Entrepreneurial activity and attitudes",
+            indicator_count=15
+        ),
+        "GEM_NES": DatasetMeta(
+            name="National Expert Survey",
+            organization="Global Entrepreneurship Monitor",
+            themes=("Entrepreneurship", "Business"),
+            description="Expert assessments of entrepreneurship conditions",
+            indicator_count=12
+        ),
+        "GI_AII": DatasetMeta(
+            name="Global Innovation Index",
+            organization="Global Innovation Index",
+            themes=("Innovation", "Technology", "Economy"),
+            description="Innovation capabilities and results across countries",
+            indicator_count=114
+        ),
+        "IDB_INFRALATAM": DatasetMeta(
+            name="InfraLatam",
+            organization="Inter-American Development Bank",
+            themes=("Infrastructure", "Transportation", "Energy"),
+            description="Infrastructure investment in Latin America",
+            indicator_count=3
+        ),
+        "IFC_GB": DatasetMeta(
+            name="Global Business Environment",
+            organization="IFC",
+            themes=("Business", "Economy", "Regulation"),
+            description="Business environment and regulatory quality",
+            indicator_count=1
+        ),
+        "ILO_EMP": DatasetMeta(
+            name="Employment Statistics",
+            organization="ILO",
+            themes=("Employment", "Labor", "Economy"),
+            description="Labor market statistics including employment, unemployment, and wages",
+            indicator_count=6
+        ),
+        "IMF_BOP": DatasetMeta(
+            name="Balance of Payments",
+            organization="IMF",
+            themes=("Trade", "Finance", "Current Account"),
+            description="International transactions including trade balance and capital flows",
+            indicator_count=5209
+        ),
+        "IMF_BOPAGG": DatasetMeta(
+            name="Balance of Payments Aggregates",
+            organization="IMF",
+            themes=("Trade", "Finance"),
+            description="Aggregated balance of payments statistics",
+            indicator_count=38
+        ),
+        "IMF_CDIR": DatasetMeta(
+            name="Coordinated Direct Investment",
+            organization="IMF",
+            themes=("Economy", "Finance", "Investment"),
+            description="Direct investment positions by country",
+            indicator_count=4
+        ),
+        "IMF_CDIS": DatasetMeta(
+            name="Coordinated Direct Investment Survey",
+            organization="IMF",
+            themes=("Economy", "Finance", "Investment"),
+            description="Direct investment survey data",
+            indicator_count=20
+        ),
+        "IMF_CPIS": DatasetMeta(
+            name="Coordinated Portfolio Investment Survey",
+            organization="IMF",
+            themes=("Economy", "Finance", "Investment"),
+            description="Portfolio investment holdings by country",
+            indicator_count=50
+        ),
+        "IMF_ET": DatasetMeta(
+            name="Exchange Rates",
+            organization="IMF",
+            themes=("Economy", "Finance", "Currency"),
+            description="Exchange rate data and currency statistics",
+            indicator_count=5
+        ),
+        "IMF_FAS": DatasetMeta(
+            name="Financial Access Survey",
+            organization="IMF",
+            themes=("Finance", "Financial Inclusion"),
+            description="Financial access and inclusion indicators",
+            indicator_count=82
+        ),
+        "IMF_FFS": DatasetMeta(
+            name="Financial Fragility Survey",
+            organization="IMF",
+            themes=("Finance", "Financial Stability"),
+            description="Financial fragility and stability metrics",
+            indicator_count=21
+        ),
+        "IMF_FISCALDECENTRALIZATION": DatasetMeta(
+            name="Fiscal Decentralization",
+            organization="IMF",
+            themes=("Fiscal", "Government", "Public Finance"),
+            description="Fiscal decentralization indicators",
+            indicator_count=36
+        ),
+        "IMF_FSI": DatasetMeta(
+            name="Financial Soundness Indicators",
+            organization="IMF",
+            themes=("Finance", "Banking", "Financial Stability"),
+            description="Banking sector health and stability indicators",
+            indicator_count=593
+        ),
+        "IMF_FSIRE": DatasetMeta(
+            name="FSI Regulatory",
+            organization="IMF",
+            themes=("Finance", "Banking", "Regulation"),
+            description="Financial soundness regulatory indicators",
+            indicator_count=21
+        ),
+        "IMF_GFSCOFOG": DatasetMeta(
+            name="Government Finance - COFOG",
+            organization="IMF",
+            themes=("Fiscal", "Government"),
+            description="Government expenditure by function",
+            indicator_count=80
+        ),
+        "IMF_GFSE": DatasetMeta(
+            name="Government Finance Statistics",
+            organization="IMF",
+            themes=("Fiscal", "Government", "Public Finance"),
+            description="Government revenue, expenditure, and debt",
+            indicator_count=48
+        ),
+        "IMF_GFSIBS": DatasetMeta(
+            name="GFS Integrated Balance Sheet",
+            organization="IMF",
+            themes=("Fiscal", "Government"),
+            description="Government balance sheet data",
+            indicator_count=15
+        ),
+        "IMF_GFSMAB": DatasetMeta(
+            name="GFS Main Aggregates",
+            organization="IMF",
+            themes=("Fiscal", "Government"),
+            description="Main government finance aggregates",
+            indicator_count=70
+        ),
+        "IMF_GFSR": DatasetMeta(
+            name="Global Financial Stability Report",
+            organization="IMF",
+            themes=("Finance", "Financial Stability"),
+            description="Global financial stability assessments",
+            indicator_count=84
+        ),
+        "IMF_GFSSSUC": DatasetMeta(
+            name="GFS Summary",
+            organization="IMF",
+            themes=("Fiscal", "Government"),
+            description="Summary government finance statistics",
+            indicator_count=26
+        ),
+        "IMF_IRFCL": DatasetMeta(
+            name="International Reserves and Foreign Currency",
+            organization="IMF",
+            themes=("Finance", "Reserves", "Currency"),
+            description="International reserves and liquidity data",
+            indicator_count=120
+        ),
+        "IMF_PCTOT": DatasetMeta(
+            name="Primary Commodity Prices",
+            organization="IMF",
+            themes=("Economy", "Commodities", "Prices"),
+            description="Primary commodity price indices",
+            indicator_count=6
+        ),
+        "IMF_WEO": DatasetMeta(
+            name="World Economic Outlook",
+            organization="IMF",
+            themes=("Economy", "GDP", "Fiscal Policy", "Forecasts"),
+            description="Macroeconomic indicators and projections for 190+ countries",
+            indicator_count=44
+        ),
+        "ITU_DH": DatasetMeta(
+            name="Digital Health",
+            organization="ITU",
+            themes=("Health", "Technology", "Digital"),
+            description="Digital health technology indicators",
+            indicator_count=39
+        ),
+        "ITU_GCI": DatasetMeta(
+            name="ICT Development Index",
+            organization="ITU",
+            themes=("Technology", "Telecommunications", "Innovation"),
+            description="ICT development and infrastructure",
+            indicator_count=26
+        ),
+        "ITU_ICT": DatasetMeta(
+            name="ICT Indicators",
+            organization="ITU",
+            themes=("Technology", "Telecommunications", "Digital"),
+            description="Information and communication technology adoption and access",
+            indicator_count=10
+        ),
+        "JRC_EDGAR": DatasetMeta(
+            name="Emissions Database",
+            organization="Joint Research Centre",
+            themes=("Environment", "Climate", "Emissions"),
+            description="Greenhouse gas emissions by country and sector",
+            indicator_count=10
+        ),
+        "OECDWBG_PMR": DatasetMeta(
+            name="Product Market Regulation",
+            organization="OECD",
+            themes=("Economy", "Regulation", "Business"),
+            description="Product market regulation indicators",
+            indicator_count=33
+        ),
+        "OECD_BROADBAND": DatasetMeta(
+            name="Broadband Statistics",
+            organization="OECD",
+            themes=("Technology", "Telecommunications", "Infrastructure"),
+            description="Broadband penetration and quality metrics",
+            indicator_count=11
+        ),
+        "OECD_IDD": DatasetMeta(
+            name="International Development Database",
+            organization="OECD",
+            themes=("Development", "Aid", "Finance"),
+            description="Official development assistance and aid flows",
+            indicator_count=53
+        ),
+        "OECD_TIVA": DatasetMeta(
+            name="Trade in Value Added",
+            organization="OECD",
+            themes=("Trade", "Economy", "Value Chains"),
+            description="Global value chain participation and trade in value added",
+            indicator_count=24
+        ),
+        "OWID_CB": DatasetMeta(
+            name="Our World in Data",
+            organization="Our World in Data",
+            themes=("Research", "Development", "Multiple"),
+            description="Research-based development indicators across multiple topics",
+            indicator_count=76
+        ),
+        "POLITY5_PRC": DatasetMeta(
+            name="Polity5 Political Regime",
+            organization="Center for Systemic Peace",
+            themes=("Governance", "Political Systems", "Democracy"),
+            description="Political regime characteristics and transitions",
+            indicator_count=14
+        ),
+        "RWB_PFI": DatasetMeta(
+            name="Press Freedom Index",
+            organization="Reporters Without Borders",
+            themes=("Governance", "Media", "Freedom"),
+            description="Press freedom and journalist safety",
+            indicator_count=12
+        ),
+        "UIS_EDSTATS": DatasetMeta(
+            name="UNESCO Education Statistics",
+            organization="UNESCO Institute for Statistics",
+            themes=("Education", "Literacy", "Skills"),
+            description="Detailed education statistics from pre-primary to tertiary",
+            indicator_count=41
+        ),
+        "UNCTAD_DE": DatasetMeta(
+            name="Development Economics",
+            organization="UNCTAD",
+            themes=("Economy", "Development", "Trade"),
+            description="Economic development and trade indicators",
+            indicator_count=14
+        ),
+        "UNCTAD_MT": DatasetMeta(
+            name="Maritime Transport",
+            organization="UNCTAD",
+            themes=("Trade", "Transportation", "Logistics"),
+            description="Maritime transport and port statistics",
+            indicator_count=9
+        ),
+        "UNDRR_SFM": DatasetMeta(
+            name="Sendai Framework Monitor",
+            organization="UN Office for Disaster Risk Reduction",
+            themes=("Environment", "Disaster Risk", "Resilience"),
+            description="Disaster risk reduction indicators",
+            indicator_count=36
+        ),
+        "UNESCO_UIS": DatasetMeta(
+            name="UNESCO Institute for Statistics",
+            organization="UNESCO",
+            themes=("Education", "Science", "Culture", "Communication"),
+            description="Education, science, culture and communication statistics",
+            indicator_count=2
+        ),
+        "UNICEF_DW": DatasetMeta(
+            name="UNICEF Data Warehouse",
+            organization="UNICEF",
+            themes=("Health", "Education", "Child Welfare", "Nutrition"),
+            description="Child-focused development indicators covering health, education, and protection",
+            indicator_count=16
+        ),
+        "UNSD_EI": DatasetMeta(
+            name="Environment Indicators",
+            organization="UN Statistics Division",
+            themes=("Environment", "Sustainability"),
+            description="Environmental and sustainability indicators",
+            indicator_count=20
+        ),
+        "VDEM_CORE": DatasetMeta(
+            name="Varieties of Democracy",
+            organization="V-Dem Institute",
+            themes=("Governance", "Democracy", "Political Rights"),
+            description="Comprehensive democracy indicators covering electoral, liberal, participatory, deliberative, and egalitarian principles",
+            indicator_count=84
+        ),
+        "WB_BID": DatasetMeta(
+            name="Business Intelligence Dashboard",
+            organization="World Bank",
+            themes=("Business", "Economy"),
+            description="Business intelligence indicators",
+            indicator_count=4
+        ),
+        "WB_BOOST": DatasetMeta(
+            name="BOOST Public Expenditure",
+            organization="World Bank",
+            themes=("Fiscal", "Government", "Public Finance"),
+            description="Government expenditure data by sector and economic classification",
+            indicator_count=232
+        ),
+        "WB_BPS": DatasetMeta(
+            name="Business Pulse Survey",
+            organization="World Bank",
+            themes=("Business", "Economy", "COVID-19"),
+            description="Business impacts from COVID-19 pandemic",
+            indicator_count=28
+        ),
+        "WB_BREADY": DatasetMeta(
+            name="Business Ready",
+            organization="World Bank",
+            themes=("Business", "Regulation"),
+            description="Business regulatory environment indicators",
+            indicator_count=3
+        ),
+        "WB_CCDFS": DatasetMeta(
+            name="Climate Change Data and Finance",
+            organization="World Bank",
+            themes=("Climate", "Environment", "Finance"),
+            description="Climate change and finance data",
+            indicator_count=23
+        ),
+        "WB_CCKP": DatasetMeta(
+            name="Climate Change Knowledge Portal",
+            organization="World Bank",
+            themes=("Climate", "Environment"),
+            description="Climate change projections and historical data",
+            indicator_count=40
+        ),
+        "WB_CLEAR": DatasetMeta(
+            name="Country Learning and Evaluation",
+            organization="World Bank",
+            themes=("Development", "Evaluation"),
+            description="Country learning and evaluation indicators",
+            indicator_count=93
+        ),
+        "WB_CPIA": DatasetMeta(
+            name="Country Policy and Institutional Assessment",
+            organization="World Bank",
+            themes=("Governance", "Policy", "Institutions"),
+            description="Policy and institutional quality assessments",
+            indicator_count=21
+        ),
+        "WB_CSC": DatasetMeta(
+            name="Country Statistical Capacity",
+            organization="World Bank",
+            themes=("Statistics", "Data Quality"),
+            description="Statistical capacity indicators",
+            indicator_count=64
+        ),
+        "WB_EDSTATS": DatasetMeta(
+            name="Education Statistics",
+            organization="World Bank",
+            themes=("Education", "Enrollment", "Literacy"),
+            description="Comprehensive education statistics including enrollment, completion, and learning outcomes",
+            indicator_count=1071
+        ),
+        "WB_EQOSOGI": DatasetMeta(
+            name="Equity of Opportunity",
+            organization="World Bank",
+            themes=("Social", "Equality", "Opportunity"),
+            description="Equity and opportunity indicators",
+            indicator_count=6
+        ),
+        "WB_ES": DatasetMeta(
+            name="Enterprise Surveys",
+            organization="World Bank",
+            themes=("Business", "Economy", "Investment"),
+            description="Firm-level business environment data",
+            indicator_count=540
+        ),
+        "WB_ESG": DatasetMeta(
+            name="ESG Data",
+            organization="World Bank",
+            themes=("Environment", "Social", "Governance"),
+            description="Environmental, social, and governance indicators",
+            indicator_count=71
+        ),
+        "WB_EWSA": DatasetMeta(
+            name="Early Warning System",
+            organization="World Bank",
+            themes=("Economy", "Crisis", "Risk"),
+            description="Economic crisis early warning indicators",
+            indicator_count=29
+        ),
+        "WB_FINDEX": DatasetMeta(
+            name="Global Findex Database",
+            organization="World Bank",
+            themes=("Finance", "Financial Inclusion"),
+            description="Financial inclusion data covering account ownership, payments, savings, and credit",
+            indicator_count=280
+        ),
+        "WB_FSI": DatasetMeta(
+            name="Financial Sector Indicators",
+            organization="World Bank",
+            themes=("Finance", "Banking"),
+            description="Financial sector development indicators",
+            indicator_count=63
+        ),
+        "WB_GIRG": DatasetMeta(
+            name="Global Identification Challenge",
+            organization="World Bank",
+            themes=("Digital ID", "Governance"),
+            description="Data on identification systems and coverage",
+            indicator_count=6
+        ),
+        "WB_GS": DatasetMeta(
+            name="Gender Statistics",
+            organization="World Bank",
+            themes=("Gender", "Social", "Equality"),
+            description="Gender-disaggregated data across demographics, education, health, and economy",
+            indicator_count=363
+        ),
+        "WB_GTMI": DatasetMeta(
+            name="Global Trade Monitoring",
+            organization="World Bank",
+            themes=("Trade", "Economy"),
+            description="Global trade monitoring indicators",
+            indicator_count=58
+        ),
+        "WB_HCP": DatasetMeta(
+            name="Human Capital Project",
+            organization="World Bank",
+            themes=("Human Capital", "Education", "Health"),
+            description="Human capital development indicators",
+            indicator_count=133
+        ),
+        "WB_HNP": DatasetMeta(
+            name="Health Nutrition and Population",
+            organization="World Bank",
+            themes=("Health", "Nutrition", "Demographics"),
+            description="Health system performance, disease prevalence, and demographic indicators",
+            indicator_count=221
+        ),
+        "WB_LPI": DatasetMeta(
+            name="Logistics Performance Index",
+            organization="World Bank",
+            themes=("Trade", "Logistics", "Infrastructure"),
+            description="Logistics and supply chain performance",
+            indicator_count=18
+        ),
+        "WB_MPO": DatasetMeta(
+            name="Macro Poverty Outlook",
+            organization="World Bank",
+            themes=("Poverty", "Economy", "Forecasts"),
+            description="Poverty and economic outlook projections",
+            indicator_count=103
+        ),
+        "WB_RISE": DatasetMeta(
+            name="Regulatory Indicators for Sustainable Energy",
+            organization="World Bank",
+            themes=("Energy", "Regulation", "Sustainability"),
+            description="Sustainable energy regulatory framework",
+            indicator_count=38
+        ),
+        "WB_SPI": DatasetMeta(
+            name="Statistical Performance Indicators",
+            organization="World Bank",
+            themes=("Statistics", "Data Quality"),
+            description="Statistical performance and capacity indicators",
+            indicator_count=71
+        ),
+        "WB_SSGD": DatasetMeta(
+            name="Subnational Statistics on Gender",
+            organization="World Bank",
+            themes=("Gender", "Social", "Subnational"),
+            description="Subnational gender statistics",
+            indicator_count=128
+        ),
+        "WB_THINK_HAZARD": DatasetMeta(
+            name="ThinkHazard",
+            organization="World Bank",
+            themes=("Environment", "Disaster Risk", "Hazards"),
+            description="Natural hazard risk information",
+            indicator_count=11
+        ),
+        "WB_WBL": DatasetMeta(
+            name="Women Business and the Law",
+            organization="World Bank",
+            themes=("Gender", "Business", "Legal Rights"),
+            description="Gender equality in business and legal rights",
+            indicator_count=49
+        ),
+        "WB_WDI": DatasetMeta(
+            name="World Development Indicators",
+            organization="World Bank",
+            themes=("Economy", "Demographics", "Education", "Health", "Environment", "Infrastructure"),
+            description="Primary World Bank database with 1500+ indicators covering all aspects of development",
+            indicator_count=1508
+        ),
+        "WB_WGI": DatasetMeta(
+            name="Worldwide Governance Indicators",
+            organization="World Bank",
+            themes=("Governance", "Political Stability", "Rule of Law"),
+            description="Governance quality indicators across 200+ countries since 1996",
+            indicator_count=36
+        ),
+        "WB_WITS": DatasetMeta(
+            name="World Integrated Trade Solution",
+            organization="World Bank",
+            themes=("Trade", "Economy", "Tariffs"),
+            description="International trade statistics, tariffs, and trade agreements",
+            indicator_count=44
+        ),
+        "WB_WWBI": DatasetMeta(
+            name="Worldwide Bureaucracy Indicators",
+            organization="World Bank",
+            themes=("Governance", "Public Sector"),
+            description="Public sector workforce and bureaucracy indicators",
+            indicator_count=37
+        ),
+        "WEF_GCI": DatasetMeta(
+            name="Global Competitiveness Index",
+            organization="World Economic Forum",
+            themes=("Economy", "Competitiveness", "Innovation", "Infrastructure"),
+            description="National competitiveness across 12 pillars including innovation and institutions",
+            indicator_count=169
+        ),
+        "WEF_GCIHH": DatasetMeta(
+            name="Global Competitiveness Index (Historical)",
+            organization="World Economic Forum",
+            themes=("Economy", "Competitiveness", "Innovation"),
+            description="Historical global competitiveness data",
+            indicator_count=163
+        ),
+        "WEF_TTDI": DatasetMeta(
+            name="Travel & Tourism Development Index",
+            organization="World Economic Forum",
+            themes=("Tourism", "Economy", "Infrastructure"),
+            description="Tourism competitiveness and development",
+            indicator_count=140
+        ),
+        "WI_GRT": DatasetMeta(
+            name="Global Inequality Database",
+            organization="World Inequality Database",
+            themes=("Social", "Inequality", "Income"),
+            description="Income and wealth inequality data",
+            indicator_count=4
+        ),
+        "WJP_ROL": DatasetMeta(
+            name="Rule of Law Index",
+            organization="World Justice Project",
+            themes=("Governance", "Justice", "Rule of Law"),
+            description="Rule of law performance across multiple dimensions",
+            indicator_count=53
+        ),
+        "WRI_CLIMATEWATCH": DatasetMeta(
+            name="Climate Watch",
+            organization="World Resources Institute",
+            themes=("Climate", "Environment", "Policy"),
+            description="Climate change data and policy tracking",
+            indicator_count=2
+        ),
+    }
+    
+    # Organizations and themes repeat across entries; share one object per distinct string
+    return types.MappingProxyType({
+        code: info._replace(organization=sys.intern(info.organization),
+                            themes=tuple(sys.intern(theme) for theme in info.themes))
+        for code, info in catalog.items()
+    })
+
+
+DATABASE_CATALOG = load_database_catalog()
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog_columns() -> Tuple:
+    """Column-oriented copy of the catalog: parallel arrays with themes in CSR form"""
+    catalog = load_database_catalog()
+    codes = tuple(catalog)
+    rows = [catalog[code] for code in codes]
+    
+    indicator_counts = np.array([row.indicator_count for row in rows], dtype=np.int32)
+    themes_flat = tuple(theme for row in rows for theme in row.themes)
+    themes_offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+    np.cumsum([len(row.themes) for row in rows], out=themes_offsets[1:])
+    
+    # Shared by every session, so freeze the arrays
+    indicator_counts.setflags(write=False)
+    themes_offsets.setflags(write=False)
+    return (codes,
+            tuple(row.name for row in rows),
+            tuple(row.organization for row in rows),
+            tuple(row.description for row in rows),
+            indicator_counts, themes_flat, themes_offsets,
+            {code: i for i, code in enumerate(codes)})
+
+
+(_CAT_CODES, _CAT_NAMES, _CAT_ORGS, _CAT_DESC, _CAT_INDICATOR_COUNT,
+ _CAT_THEMES_FLAT, _CAT_THEMES_OFFSETS, _CODE_TO_IDX) = load_catalog_columns()
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog_text() -> Tuple[bytes, np.ndarray]:
+    """Lowercased codes, names and descriptions in one UTF-8 buffer, with each row's start offset"""
+    rows = [f"{code}\x00{name}\x00{desc}\x00".lower().encode("utf-8")
+            for code, name, desc in zip(_CAT_CODES, _CAT_NAMES, _CAT_DESC)]
+    offsets = np.zeros(len(rows) + 1, dtype=np.int32)
+    np.cumsum([len(row) for row in rows], out=offsets[1:])
+    offsets.setflags(write=False)
+    return b"".join(rows), offsets
+
+
+_CAT_TEXT_BUF, _CAT_TEXT_OFFSETS = load_catalog_text()
+
+
+def _rows_mentioning(text: str) -> np.ndarray:
+    """Boolean row mask of entries whose code, name or description contains text (case-insensitive)"""
+    mask = np.zeros(len(_CAT_CODES), dtype=bool)
+    needle = text.lower().replace("\x00", "").encode("utf-8")
+    pos = _CAT_TEXT_BUF.find(needle)
+    while pos != -1:
+        row = np.searchsorted(_CAT_TEXT_OFFSETS, pos, side="right") - 1
+        mask[row] = True
+        # One hit per row is enough; resume at the next row
+        pos = _CAT_TEXT_BUF.find(needle, _CAT_TEXT_OFFSETS[row + 1])
+    return mask
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog_indexes() -> Tuple[types.MappingProxyType, types.MappingProxyType]:
+    """Inverted indexes theme -> codes and org -> codes"""
+    theme_to_codes = defaultdict(list)
+    org_to_codes = defaultdict(list)
+    for i, code in enumerate(_CAT_CODES):
+        org_to_codes[_CAT_ORGS[i]].append(code)
+        for theme in _CAT_THEMES_FLAT[_CAT_THEMES_OFFSETS[i]:_CAT_THEMES_OFFSETS[i + 1]]:
+            theme_to_codes[theme].append(code)
+    
+    freeze = lambda index: types.MappingProxyType({key: tuple(codes) for key, codes in index.items()})
+    return freeze(theme_to_codes), freeze(org_to_codes)
+
+
+THEME_TO_CODES, ORG_TO_CODES = load_catalog_indexes()
+
+# Facet counts for the header filters
+THEME_COUNTS = types.MappingProxyType({theme: len(codes) for theme, codes in THEME_TO_CODES.items()})
+ORG_COUNTS = types.MappingProxyType({org: len(codes) for org, codes in ORG_TO_CODES.items()})
+THEME_OPTIONS = tuple(sorted(THEME_COUNTS))
+ORG_OPTIONS = tuple(sorted(ORG_COUNTS))
+
+
+def catalog_codes_matching(organizations: Optional[Sequence[str]] = None,
+                           themes: Optional[Sequence[str]] = None, text: Optional[str] = None) -> List[str]:
+    """Catalog codes in any of the organizations, tagged with any of the themes and mentioning text, in catalog order"""
+    mask = np.ones(len(_CAT_CODES), dtype=bool)
+    if organizations:
+        org_mask = np.zeros(len(_CAT_CODES), dtype=bool)
+        org_mask[[_CODE_TO_IDX[code] for org in organizations for code in ORG_TO_CODES.get(org, ())]] = True
+        mask &= org_mask
+    if themes:
+        theme_ids = [_THEME_ID[theme] for theme in themes if theme in _THEME_ID]
+        mask &= _ROW_HAS_THEME[:, theme_ids].any(axis=1)
+    if text:
+        mask &= _rows_mentioning(text)
+    return [_CAT_CODES[i] for i in np.flatnonzero(mask)]
+
+
+def database_name(database_id: str) -> str:
+    """Display name of a database, falling back to its code"""
+    info = DATABASE_CATALOG.get(database_id)
+    return info.name if info else database_id
+
+
+def total_indicators() -> int:
+    """Indicators across every catalog database"""
+    return int(_CAT_INDICATOR_COUNT.sum())
+
+
+@st.cache_resource(show_spinner=False)
+def load_catalog_name_rank() -> np.ndarray:
+    """Each catalog row's position in name order, so name sorts compare integers"""
+    rank = np.empty(len(_CAT_CODES), dtype=np.int32)
+    rank[sorted(range(len(_CAT_CODES)), key=_CAT_NAMES.__getitem__)] = np.arange(len(_CAT_CODES), dtype=np.int32)
+    rank.setflags(write=False)
+    return rank
+
+
+_CAT_NAME_RANK = load_catalog_name_rank()
+
+
+def catalog_page(codes: Sequence[str], by_count: bool, start: int, stop: int) -> List[str]:
+    """codes ordered by name (or indicator count, largest first), sliced to [start:stop]"""
+    rows = np.fromiter((_CODE_TO_IDX[code] for code in codes), dtype=np.intp, count=len(codes))
+    if by_count:
+        # Ties keep their order in codes, so every key is unique and pages never overlap
+        keys = -_CAT_INDICATOR_COUNT[rows].astype(np.int64) * len(rows) + np.arange(len(rows))
+    else:
+        keys = _CAT_NAME_RANK[rows]
+    stop = min(stop, len(rows))
+    if start >= stop:
+        return []
+    # Only the first stop rows need ordering
+    if stop < len(rows):
+        head = np.argpartition(keys, stop - 1)[:stop]
+        head = head[np.argsort(keys[head])]
+    else:
+        head = np.argsort(keys)
+    return [codes[i] for i in head[start:]]
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def catalog_views(organizations: Tuple[str, ...],
+                  themes: Tuple[str, ...]) -> Tuple[List[str], List[str], List[str]]:
+    """Codes matching the filters in catalog, indicator-count and code order"""
+    codes = catalog_codes_matching(organizations, themes)
+    return codes, catalog_page(codes, True, 0, len(codes)), sorted(codes)
+
 
 THEME_TAXONOMY = {
     "Economy": ["GDP", "Growth", "Trade", "Investment", "Employment", "Productivity", "Fiscal Policy"],
@@ -902,13 +1479,62 @@ INCOME_GROUPS = {
 }
 
 
+@st.cache_resource(show_spinner=False)
+def load_theme_vocab() -> Tuple:
+    """Dictionary-encode catalog themes: vocabulary, theme -> id and a row x theme matrix"""
+    vocab = tuple(dict.fromkeys(
+        _CAT_THEMES_FLAT + tuple(THEME_TAXONOMY) + tuple(topic for topics in THEME_TAXONOMY.values() for topic in topics)
+    ))
+    theme_id = {theme: i for i, theme in enumerate(vocab)}
+    
+    theme_ids = np.fromiter((theme_id[theme] for theme in _CAT_THEMES_FLAT), dtype=np.int16, count=len(_CAT_THEMES_FLAT))
+    rows = np.repeat(np.arange(len(_CAT_CODES)), np.diff(_CAT_THEMES_OFFSETS))
+    row_has_theme = np.zeros((len(_CAT_CODES), len(vocab)), dtype=bool)
+    row_has_theme[rows, theme_ids] = True
+    
+    row_has_theme.setflags(write=False)
+    return vocab, theme_id, row_has_theme
+
+
+THEME_VOCAB, _THEME_ID, _ROW_HAS_THEME = load_theme_vocab()
+
+
+# Columnar view of COMMON_COUNTRIES: parallel code/name tuples plus a sorted copy for batch lookups
+_CC_CODES = tuple(COMMON_COUNTRIES)
+_CC_NAMES = tuple(sys.intern(name) for name in COMMON_COUNTRIES.values())
+_CC_INDEX = {code: i for i, code in enumerate(_CC_CODES)}
+_CC_ORDER = np.argsort(_CC_CODES)
+_CC_SORTED_CODES = np.array(_CC_CODES)[_CC_ORDER]
+_CC_SORTED_NAMES = np.array(_CC_NAMES, dtype=object)[_CC_ORDER]
+
+
+def country_name(code: str) -> str:
+    """Display name for an ISO3 code, falling back to the code"""
+    i = _CC_INDEX.get(code)
+    return code if i is None else _CC_NAMES[i]
+
+
+def country_names(codes: Sequence[str]) -> np.ndarray:
+    """Vectorized country_name over an array of codes"""
+    codes = np.asarray(codes, dtype=object)
+    keys = codes.astype(str)
+    pos = np.minimum(np.searchsorted(_CC_SORTED_CODES, keys), len(_CC_SORTED_CODES) - 1)
+    return np.where(_CC_SORTED_CODES[pos] == keys, _CC_SORTED_NAMES[pos], codes)
+
+
+def country_labels(codes: pd.Series) -> pd.Series:
+    """country_name over a Series, translating each distinct code once (categories for categorical codes)"""
+    uniques = pd.unique(codes)
+    return codes.map(dict(zip(uniques, country_names(np.asarray(uniques, dtype=object)))))
+
+
 # ============================================================================
 # CACHING FUNCTIONS
 # ============================================================================
 
-@st.cache_data(ttl=3600)
-def discover_databases():
-    """Cached database discovery"""
+@st.cache_resource(show_spinner=False)
+def discover_databases() -> Tuple[str, ...]:
+    """Known database ids, shared process-wide without per-hit copies"""
     known_databases = [
         'BS_BTI', 'BS_SGI', 'FAO_AS', 'FH_FIW', 'GEM_APS', 'GEM_NES', 'GI_AII',
         'IDB_INFRALATAM', 'IFC_GB', 'ILO_EMP', 'IMF_BOP', 'IMF_BOPAGG', 'IMF_CDIR',
@@ -925,70 +1551,137 @@ def discover_databases():
         'WB_THINK_HAZARD', 'WB_WBL', 'WB_WDI', 'WB_WGI', 'WB_WITS', 'WB_WWBI',
         'WEF_GCI', 'WEF_GCIHH', 'WEF_TTDI', 'WI_GRT', 'WJP_ROL', 'WRI_CLIMATEWATCH'
     ]
-    return sorted(known_databases)
+    return tuple(sorted(known_databases))
 
 
-@st.cache_data(ttl=3600)
-def get_indicators_with_metadata(database_id: str, limit: int = 500):
-    """Get indicators with improved names"""
-    client = Data360Client()
+@st.cache_resource(show_spinner=False)
+def load_cache_meters() -> Dict[str, Any]:
+    """Process-wide call/miss counts and timings per metered cache"""
+    return {"lock": threading.Lock(),
+            "meters": defaultdict(lambda: {"calls": 0, "seconds": 0.0, "misses": 0, "miss_seconds": 0.0})}
+
+
+def metered(name: str, miss: bool = False):
+    """Time calls to the decorated function under name; with miss=True, place it under
+    st.cache_data so it only sees the calls the cache did not answer"""
+    calls, seconds = ("misses", "miss_seconds") if miss else ("calls", "seconds")
+    
+    def decorate(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                state = load_cache_meters()
+                with state["lock"]:
+                    meter = state["meters"][name]
+                    meter[calls] += 1
+                    meter[seconds] += elapsed
+        return wrapper
+    return decorate
+
+
+# Room for every discovered database, so "Preload all indicator lists" evicts none of what it loads
+@metered("get_indicators_with_metadata")
+@st.cache_data(ttl=21600, max_entries=128, show_spinner=False)
+@metered("get_indicators_with_metadata", miss=True)
+def _indicator_rows(database_id: str, limit: int = 500) -> List[Tuple]:
+    client = get_client()
     
     try:
-        filter_str = f"series_description/database_id eq '{database_id}'"
-        result = client.search("*", top=min(limit, 1000), filter_by=filter_str)
-        
-        indicators = []
-        if "value" in result and result["value"]:
-            for item in result["value"]:
-                desc = item.get("series_description", {})
-                if desc.get("idno"):
-                    raw_name = desc.get("name", "")
-                    indicator_id = desc.get("idno")
-                    
-                    if raw_name and len(raw_name) > 20 and not raw_name.isupper():
-                        display_name = raw_name
-                    else:
-                        display_name = decode_indicator_name(indicator_id, raw_name)
-                    
-                    indicators.append({
-                        "id": indicator_id,
-                        "name": display_name,
-                        "description": desc.get("description", ""),
-                        "topics": [t.get("name", "") for t in desc.get("topics", [])],
-                        "source": desc.get("source", {}),
-                        "database_id": database_id
-                    })
-            
-            if indicators:
-                return indicators[:limit]
-        
-        indicator_ids = client.list_indicators(database_id)
-        
-        indicators = []
-        for ind_id in indicator_ids[:limit]:
-            display_name = decode_indicator_name(ind_id)
-            indicators.append({
-                "id": ind_id,
-                "name": display_name,
-                "description": f"Indicator from {DATABASE_CATALOG.get(database_id, {}).get('name', database_id)}",
-                "topics": [],
-                "source": {},
-                "database_id": database_id
-            })
+        # Browse the full listing rather than a ranked search, then enrich it with metadata
+        indicator_ids = api_list_indicators(client, database_id)[:limit]
+        
+        try:
+            metadata = api_indicators_metadata(client, tuple(indicator_ids))
+        except requests.RequestException:
+            metadata = {}
+        
+        fallback_description = f"Indicator from {database_name(database_id)}"
         
+        # decode_indicator_name passes readable raw names through unchanged
+        indicators = [
+            tuple(IndicatorMeta(
+                id=ind_id,
+                name=decode_indicator_name(ind_id, desc.get("name", "")),
+                description=desc.get("description") or fallback_description,
+                topics=tuple(t.get("name", "") for t in desc.get("topics", [])),
+                database_id=database_id,
+                source=desc.get("source", {}),
+            ))
+            for ind_id in indicator_ids
+            for desc in [metadata.get(ind_id, {}).get("series_description", {})]
+        ]
         return indicators
     except Exception as e:
         st.error(f"Could not load indicators for {database_id}: {str(e)}")
         return []
 
 
-@st.cache_data(ttl=3600)
-def search_indicators_filtered(query: str, themes: List[str] = None,
-                               databases: List[str] = None,
-                               organizations: List[str] = None,
-                               limit: int = 100):
-    """Search with filters"""
-    client = Data360Client()
+def get_indicators_with_metadata(database_id: str, limit: int = 500) -> List[IndicatorMeta]:
+    """Get indicators with improved names"""
+    return [IndicatorMeta._make(row) for row in _indicator_rows(database_id, limit)]
+
+
+@st.cache_data(ttl=21600, max_entries=128, show_spinner=False)
+def _search_keys(database_id: str) -> Tuple[str, ...]:
+    return tuple(f"{ind.name}\x00{ind.id}\x00{ind.description}".lower()
+                 for ind in map(IndicatorMeta._make, _indicator_rows(database_id)))
+
+
+def indicators_with_search_keys(database_id: str) -> Tuple[List[IndicatorMeta], Tuple[str, ...]]:
+    """A database's indicators plus a lowercased name/id/description key for each"""
+    return get_indicators_with_metadata(database_id), _search_keys(database_id)
+
+
+def cache_stats() -> pd.DataFrame:
+    """Memory per Streamlit cache, as reported by the runtime"""
+    rows = []
+    if runtime.exists():
+        stats = runtime.get_instance().stats_mgr.get_stats()
+        if isinstance(stats, dict):
+            stats = [stat for family in stats.values() for stat in family]
+        rows = [(stat.category_name, stat.cache_name, stat.byte_length)
+                for stat in stats if hasattr(stat, "byte_length")]
+    
+    df = pd.DataFrame(rows, columns=["category", "cache", "bytes"])
+    return df.groupby(["category", "cache"], as_index=False)["bytes"].sum().sort_values("bytes", ascending=False)
+
+
+def cache_hit_stats() -> pd.DataFrame:
+    """Hit rate and mean hit/miss latency per metered cache since the server started"""
+    state = load_cache_meters()
+    with state["lock"]:
+        meters = {name: dict(meter) for name, meter in state["meters"].items()}
+    
+    rows = []
+    for name, m in meters.items():
+        hits = max(m["calls"] - m["misses"], 0)
+        rows.append((name, m["calls"], hits / m["calls"] if m["calls"] else 0.0,
+                     1000 * max(m["seconds"] - m["miss_seconds"], 0.0) / hits if hits else None,
+                     1000 * m["miss_seconds"] / m["misses"] if m["misses"] else None))
+    return pd.DataFrame(rows, columns=["cache", "calls", "hit rate", "hit ms", "miss ms"])
+
+
+def warmup_all_catalogs(databases: Sequence[str], max_workers: int = 10) -> int:
+    """Load every database's indicator list concurrently into the cache; returns how many came back non-empty"""
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(databases) or 1)) as executor:
+        return sum(1 for indicators in executor.map(_indicator_rows, databases) if indicators)
+
+
+def prefetch_indicators(database_id: str) -> None:
+    """Warm the indicator list for database_id on a background thread, ahead of 'Load Indicators'"""
+    threading.Thread(target=_indicator_rows, args=(database_id,), daemon=True).start()
+
+
+@st.cache_data(ttl=900, max_entries=128)
+def _search_rows(query: str, themes: Optional[Tuple[str, ...]] = None,
+                 databases: Optional[Tuple[str, ...]] = None,
+                 organizations: Optional[Tuple[str, ...]] = None,
+                 limit: int = 100) -> Tuple[List[Tuple], int]:
+    client = get_client()
     
     if not query or query.strip() == "" or query == "*":
         query = "GDP"
@@ -996,39 +1689,34 @@ def search_indicators_filtered(query: str, themes: List[str] = None,
     filters = []
     
     if organizations:
-        org_databases = [
-            db_id for db_id, info in DATABASE_CATALOG.items()
-            if info['organization'] in organizations
-        ]
+        org_databases = catalog_codes_matching(organizations=organizations)
         if org_databases:
-            db_filter = " or ".join([f"series_description/database_id eq '{db}'" for db in org_databases])
-            filters.append(f"({db_filter})")
+            filters.append(build_database_filter(tuple(org_databases)))
     elif databases:
-        db_filter = " or ".join([f"series_description/database_id eq '{db}'" for db in databases])
-        filters.append(f"({db_filter})")
+        filters.append(build_database_filter(tuple(databases)))
     
     if themes:
-        theme_filter = " or ".join([f"series_description/topics/any(t: t/name eq '{theme}')" for theme in themes])
-        filters.append(f"({theme_filter})")
+        filters.append(build_theme_filter(tuple(themes)))
     
     filter_str = " and ".join(filters) if filters else None
     
     try:
-        result = client.search(query, top=limit, filter_by=filter_str)
-        
-        indicators = []
-        if "value" in result and result["value"]:
-            for item in result["value"]:
-                desc = item.get("series_description", {})
-                if desc.get("idno"):
-                    indicators.append({
-                        "id": desc.get("idno"),
-                        "name": desc.get("name"),
-                        "description": desc.get("description", ""),
-                        "topics": [t.get("name", "") for t in desc.get("topics", [])],
-                        "database_id": desc.get("database_id"),
-                        "source": desc.get("source", {})
-                    })
+        # Results are listed by name only; details are fetched for the one that gets selected
+        result = api_search(client, query, top=limit, filter_by=filter_str, fields=LIST_FIELDS)
+        
+        indicators = [
+            tuple(IndicatorMeta(
+                id=desc["idno"],
+                name=desc.get("name") or "",
+                description=desc.get("description") or "",
+                topics=tuple(t.get("name", "") for t in desc.get("topics", [])),
+                database_id=desc.get("database_id") or "",
+                source=desc.get("source", {}),
+            ))
+            for item in result.get("value") or []
+            for desc in [item.get("series_description", {})]
+            if desc.get("idno")
+        ]
         
         return indicators, result.get("@odata.count", len(indicators))
     except Exception as e:
@@ -1039,58 +1727,120 @@ def search_indicators_filtered(query: str, themes: List[str] = None,
         return [], 0
 
 
-@st.cache_data(ttl=3600)
-def fetch_data_cached(database_id: str, indicator: str, countries: List[str],
-                     year_from: str, year_to: str):
-    """Cached data fetch"""
-    client = Data360Client()
-    all_data = []
-    
-    for country in countries:
-        try:
-            data = client.get_data(
-                database_id=database_id,
-                indicator=indicator,
-                ref_area=country,
-                time_period_from=year_from,
-                time_period_to=year_to,
-                auto_paginate=True,
-                max_records=5000
-            )
-            all_data.extend(data.get("value", []))
-        except Exception:
-            pass
+def search_indicators_filtered(query: str, themes: Optional[Tuple[str, ...]] = None,
+                               databases: Optional[Tuple[str, ...]] = None,
+                               organizations: Optional[Tuple[str, ...]] = None,
+                               limit: int = 100) -> Tuple[List[IndicatorMeta], int]:
+    """Search with filters"""
+    rows, total = _search_rows(query, themes, databases, organizations, limit)
+    return [IndicatorMeta._make(row) for row in rows], total
+
+
+def with_details(ind: IndicatorMeta) -> IndicatorMeta:
+    """ind with description, topics and source filled in if it came from a list-only search"""
+    if ind.description:
+        return ind
+    try:
+        items = api_indicator_metadata(get_client(), ind.id).get("value") or []
+    except requests.RequestException:
+        return ind
+    desc = items[0].get("series_description", {}) if items else {}
+    return ind._replace(description=desc.get("description") or "",
+                        topics=tuple(t.get("name", "") for t in desc.get("topics", [])),
+                        source=desc.get("source", {}))
+
+
+@st.cache_data(ttl=DAY, max_entries=5000, show_spinner=False)
+@metered("fetch_data_cached", miss=True)
+def _fetch_data_cached(database_id: str, indicator: str, countries: Tuple[str, ...],
+                       year_from: str, year_to: str) -> pd.DataFrame:
+    client = get_client()
+    # PartialDataError propagates, so a fetch missing some countries is never cached
+    if len(countries) > 1:
+        data = api_get_data_multi(client, database_id, indicator, countries,
+                                  time_period_from=year_from, time_period_to=year_to)
+    else:
+        data = api_get_data(
+            client,
+            database_id=database_id,
+            indicator=indicator,
+            ref_area=countries[0],
+            time_period_from=year_from,
+            time_period_to=year_to,
+            auto_paginate=True,
+            max_records=5000
+        )
+    return compact_frame(data.get("value", []))
+
+
+def compact_frame(records: List[Dict]) -> pd.DataFrame:
+    """DataFrame of data records with the column types the caches store"""
+    df = pd.DataFrame(records)
+    if len(df) == 0:
+        return df
+    
+    # Numeric values, categorical codes and Arrow-backed periods keep the cached frame small
+    df['OBS_VALUE'] = pd.to_numeric(df['OBS_VALUE'], errors='coerce')
+    if 'TIME_PERIOD' in df:
+        df['TIME_PERIOD'] = df['TIME_PERIOD'].astype('string[pyarrow]')
+    for column in ('REF_AREA', 'INDICATOR'):
+        if column in df:
+            df[column] = df[column].astype('category')
+    return df
+
+
+# Metered only where the cache is consulted, so early returns don't count as instant hits
+_metered_fetch_data = metered("fetch_data_cached")(_fetch_data_cached)
+
+
+def fetch_data_cached(database_id: str, indicator: str, countries: Sequence[str],
+                      year_from: str, year_to: str) -> pd.DataFrame:
+    """Cached data fetch (1 day), batching multiple countries into one query, as a compact DataFrame
     
-    return all_data
+    Countries that could not be fetched are listed in the frame's attrs["failed"].
+    """
+    if not countries:
+        return pd.DataFrame()
+    try:
+        return _metered_fetch_data(database_id, indicator, tuple(countries), year_from, year_to)
+    except PartialDataError as e:
+        logger.warning("Data fetch failed for %s/%s: %s", database_id, indicator, e)
+        df = compact_frame(e.data["value"])
+        df.attrs["failed"] = e.failed
+        return df
+    except (requests.RequestException, ValueError) as e:
+        # Network and decoding failures mean "no data" and are not cached; anything else is a bug and should surface
+        logger.warning("Data fetch failed for %s/%s: %s", database_id, indicator, e)
+        return pd.DataFrame()
 
 
 @st.cache_data(ttl=3600)
 def check_data_availability(database_id: str, indicator: str, sample_size: int = 100):
     """Quick check to see what data is available for an indicator"""
-    client = Data360Client()
+    client = get_client()
     
     try:
         # Fetch a sample to check availability
-        result = client.get_data(
+        result = api_get_data(
+            client,
             database_id=database_id,
             indicator=indicator,
             auto_paginate=True,
-            max_records=sample_size
+            max_records=sample_size,
+            columnar=True
         )
         
-        data = result.get("value", [])
-        
-        if not data:
+        if not result.get("count"):
             return None
         
-        df = pd.DataFrame(data)
+        df = Data360Client.to_dataframe(result)
         
         # Extract metadata
         countries = sorted(df['REF_AREA'].unique().tolist())
         years = sorted(df['TIME_PERIOD'].unique().tolist())
         
         availability = {
-            "total_records": len(data),
+            "total_records": len(df),
             "countries": countries,
             "country_count": len(countries),
             "years": years,
@@ -1108,25 +1858,34 @@ def check_data_availability(database_id: str, indicator: str, sample_size: int =
 # VISUALIZATION FUNCTIONS
 # ============================================================================
 
-def create_time_series_plot(df: pd.DataFrame, title: str, indicator_name: str = ""):
+def frame_key(df: pd.DataFrame) -> str:
+    """Fingerprint of a frame's columns and rows in order, computed once per fetch and used as data_key"""
+    digest = hashlib.blake2b(repr(tuple(df.columns)).encode("utf-8"), digest_size=16)
+    digest.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return f"{len(df)}:{digest.hexdigest()}"
+
+
+# Figures are cached on data_key, the frame's fingerprint, so reruns skip both
+# rebuilding them and hashing the frame's contents
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def create_time_series_plot(_df: pd.DataFrame, data_key: str, title: str, indicator_name: str = ""):
     """Create time series chart"""
-    fig = go.Figure()
+    df = _df.assign(Country=country_labels(_df['REF_AREA']))
     
-    colors = px.colors.qualitative.Set2
-    
-    for idx, country in enumerate(df['REF_AREA'].unique()):
-        country_data = df[df['REF_AREA'] == country].sort_values('TIME_PERIOD')
-        country_name = COMMON_COUNTRIES.get(country, country)
-        
-        fig.add_trace(go.Scatter(
-            x=country_data['TIME_PERIOD'],
-            y=country_data['OBS_VALUE'],
-            name=country_name,
-            mode='lines+markers',
-            line=dict(width=3, color=colors[idx % len(colors)]),
-            marker=dict(size=7, symbol='circle'),
-            hovertemplate=f'<b>{country_name}</b><br>Year: %{{x}}<br>Value: %{{y:.2f}}<extra></extra>'
-        ))
+    fig = px.line(
+        df.sort_values('TIME_PERIOD', kind='stable'),
+        x='TIME_PERIOD',
+        y='OBS_VALUE',
+        color='Country',
+        category_orders={'Country': list(pd.unique(df['Country']))},
+        markers=True,
+        color_discrete_sequence=px.colors.qualitative.Set2
+    )
+    fig.update_traces(
+        line=dict(width=3),
+        marker=dict(size=7, symbol='circle'),
+        hovertemplate='<b>%{fullData.name}</b><br>Year: %{x}<br>Value: %{y:.2f}<extra></extra>'
+    )
     
     fig.update_layout(
         title=dict(
@@ -1148,6 +1907,7 @@ def create_time_series_plot(df: pd.DataFrame, title: str, indicator_name: str =
             y=0.99,
             xanchor="left",
             x=1.02,
+            title_text='',
             bgcolor='rgba(30, 33, 48, 0.8)',
             bordercolor='#2d3142',
             borderwidth=1
@@ -1159,18 +1919,48 @@ def create_time_series_plot(df: pd.DataFrame, title: str, indicator_name: str =
     return fig
 
 
-def create_comparison_chart(df: pd.DataFrame, year: str, title: str):
+@st.cache_data(ttl=3600, max_entries=16, show_spinner=False)
+def summarize_frame(_df: pd.DataFrame, data_key: str) -> Dict[str, Any]:
+    """Headline numbers and the years present, newest first"""
+    periods = _df['TIME_PERIOD']
+    return {
+        "records": len(_df),
+        "countries": _df['REF_AREA'].nunique(),
+        "time_range": f"{periods.min()}-{periods.max()}",
+        "mean": _df['OBS_VALUE'].mean(),
+        "years": sorted(periods.unique(), reverse=True),
+    }
+
+
+@st.cache_data(ttl=3600, max_entries=8, show_spinner=False)
+def frame_csv(_df: pd.DataFrame, data_key: str) -> bytes:
+    """CSV export of the frame, serialized once per data_key"""
+    # Unquoted fields and header, as DataFrame.to_csv writes them. Arrow refuses values that
+    # would need quoting in this mode, and those frames go through to_csv instead.
+    try:
+        header = io.StringIO()
+        csv.writer(header, lineterminator="\n").writerow(_df.columns)
+        buf = io.BytesIO(header.getvalue().encode("utf-8"))
+        buf.seek(0, io.SEEK_END)
+        pa_csv.write_csv(pa.Table.from_pandas(_df, preserve_index=False), buf,
+                         pa_csv.WriteOptions(include_header=False, quoting_style="none"))
+        return buf.getvalue()
+    except (pa.ArrowException, TypeError):  # quoted values, or columns Arrow cannot write as CSV
+        return _df.to_csv(index=False).encode("utf-8")
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def create_comparison_chart(_df: pd.DataFrame, data_key: str, year: str, title: str):
     """Create bar chart"""
-    year_data = df[df['TIME_PERIOD'] == year].copy()
-    year_data['Country'] = year_data['REF_AREA'].map(lambda x: COMMON_COUNTRIES.get(x, x))
-    year_data = year_data.sort_values('OBS_VALUE', ascending=True)
+    year_data = _df.loc[_df['TIME_PERIOD'].eq(year), ['REF_AREA', 'OBS_VALUE']].sort_values('OBS_VALUE')
+    values = year_data['OBS_VALUE'].to_numpy()
     
     fig = go.Figure(go.Bar(
-        x=year_data['OBS_VALUE'],
-        y=year_data['Country'],
+        x=values,
+        y=country_labels(year_data['REF_AREA']).to_numpy(),
         orientation='h',
         marker=dict(
-            color=year_data['OBS_VALUE'],
+            color=values,
             colorscale='Viridis',
             showscale=True,
             line=dict(color='#2d3142', width=1)
@@ -1198,6 +1988,264 @@ def create_comparison_chart(df: pd.DataFrame, year: str, title: str):
     return fig
 
 
+# ============================================================================
+# BACKGROUND FETCHES
+# ============================================================================
+
+class FetchJob:
+    """Fetches an indicator's countries concurrently on a background thread"""
+    
+    def __init__(self, database_id: str, indicator: str, indicator_name: str,
+                 countries: List[str], year_from: str, year_to: str):
+        self.indicator = indicator
+        self.indicator_name = indicator_name
+        self.countries = countries
+        self.frames: Dict[str, pd.DataFrame] = {}
+        self.failed: List[str] = []
+        self.completed = 0
+        self.done = False
+        self.thread = threading.Thread(target=self._run, args=(database_id, year_from, year_to), daemon=True)
+        self.thread.start()
+    
+    def data(self) -> pd.DataFrame:
+        """Everything fetched so far, in the order the countries were requested"""
+        frames = dict(self.frames)
+        frames = [frames[country] for country in self.countries if country in frames]
+        return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    
+    def _run(self, database_id: str, year_from: str, year_to: str) -> None:
+        try:
+            # Per-country requests keep each country cached on its own and let the preview grow as they land
+            with ThreadPoolExecutor(max_workers=min(Data360Client.MAX_WORKERS, len(self.countries) or 1)) as executor:
+                futures = {
+                    executor.submit(fetch_data_cached, database_id, self.indicator, [country], year_from, year_to): country
+                    for country in self.countries
+                }
+                for future in as_completed(futures):
+                    country = futures[future]
+                    try:
+                        df = future.result()
+                    except Exception:
+                        logger.exception("Fetch failed for %s/%s/%s", database_id, self.indicator, country)
+                        self.failed.append(country)
+                    else:
+                        if len(df) > 0:
+                            self.frames[country] = df
+                    self.completed += 1
+        finally:
+            self.done = True
+
+
+def plot_frame(data: pd.DataFrame) -> pd.DataFrame:
+    """Rows with a period and a numeric value, with periods as strings for categorical axes"""
+    return data.assign(TIME_PERIOD=data['TIME_PERIOD'].astype('string[pyarrow]')).dropna(subset=['OBS_VALUE', 'TIME_PERIOD'])
+
+
+def start_fetch_job(database_id: str, indicator: str, indicator_name: str,
+                    countries: List[str], year_from: str, year_to: str) -> None:
+    """Start a background fetch; render_fetch_job() reports on it"""
+    st.session_state.fetch_job = FetchJob(database_id, indicator, indicator_name, countries, year_from, year_to)
+
+
+@st.fragment(run_every=0.5)
+def render_fetch_job():
+    """Poll the running fetch, previewing records as they arrive"""
+    job = st.session_state.get('fetch_job')
+    if job is None:
+        return
+    
+    if not job.done:
+        data = job.data()
+        st.progress(job.completed / len(job.countries),
+                    text=f"⏳ Fetching {job.indicator_name[:50]}... {len(data):,} records "
+                         f"({job.completed}/{len(job.countries)} countries)")
+        if len(data) > 0:
+            preview = plot_frame(data)
+            if len(preview) > 0:
+                st.plotly_chart(create_time_series_plot(preview, frame_key(preview), "Loading...",
+                                                        job.indicator_name),
+                                use_container_width=True)
+        return
+    
+    del st.session_state.fetch_job
+    data = job.data()
+    # Prepared once here so the visualization reruns don't re-convert the frame
+    frame = plot_frame(data) if len(data) > 0 else data
+    if len(frame) > 0:
+        st.session_state.current_data = frame
+        st.session_state.current_data_key = frame_key(frame)
+        st.session_state.current_indicator_name = job.indicator_name
+        st.session_state.current_indicator_id = job.indicator
+        st.toast(f"✅ Fetched {len(data)} records!")
+        if job.failed:
+            st.session_state.fetch_warning = f"⚠️ Could not fetch: {', '.join(job.failed)}"
+    elif len(data) > 0:
+        st.session_state.fetch_warning = "⚠️ No valid numeric data found"
+    elif job.failed:
+        st.session_state.fetch_warning = f"⚠️ Could not fetch: {', '.join(job.failed)}"
+    else:
+        st.session_state.fetch_warning = "⚠️ No data found. Try different countries or years."
+    st.rerun()
+
+
+@lru_cache(maxsize=512)
+def tags_html(tags: Tuple[str, ...]) -> str:
+    """Tag pills for a run of themes/topics; the same runs repeat across many rows"""
+    return " ".join(f'<span class="tag">{t}</span>' for t in tags if t)
+
+
+@st.fragment
+def render_indicator_explorer(database_id: str):
+    """Indicator list for the explorer; filtering reruns only this fragment"""
+    with st.spinner(f"🔄 Loading indicators from {database_id}..."):
+        # The keys are built from this same list, so they always line up with it
+        explore_indicators, search_keys = indicators_with_search_keys(database_id)
+        
+        if explore_indicators:
+            st.success(f"✅ Loaded {len(explore_indicators)} indicators")
+            
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                indicator_search = st.text_input("🔎 Filter indicators", placeholder="e.g., population, GDP...", key="explore_indicator_search")
+            with col2:
+                st.metric("Total", len(explore_indicators))
+            
+            if indicator_search:
+                search_lower = indicator_search.lower()
+                filtered_explore = [explore_indicators[k] for k, key in enumerate(search_keys) if search_lower in key]
+            else:
+                filtered_explore = explore_indicators
+            
+            st.markdown(f"### Showing {len(filtered_explore)} indicators")
+            
+            # One grid instead of a container/columns/markdown set per indicator
+            fallback_description = f"Indicator from {database_name(database_id)}"
+            table = pd.DataFrame({
+                "Indicator": [ind.name for ind in filtered_explore],
+                "ID": [ind.id for ind in filtered_explore],
+                "Description": [ind.description if ind.description != fallback_description else ""
+                                for ind in filtered_explore],
+                "Topics": [[t for t in ind.topics[:3] if t] for ind in filtered_explore],
+            })
+            event = st.dataframe(
+                table,
+                column_config={
+                    "Indicator": st.column_config.TextColumn(width="large"),
+                    "Description": st.column_config.TextColumn(width="large"),
+                    "Topics": st.column_config.ListColumn(),
+                },
+                hide_index=True,
+                use_container_width=True,
+                on_select="rerun",
+                selection_mode="single-row",
+                key=f"explore_table_{database_id}",
+            )
+            st.caption("📊 Select a row to query that indicator")
+            
+            rows = [row for row in event.selection.rows if row < len(filtered_explore)]
+            if rows:
+                ind = filtered_explore[rows[0]]
+                if getattr(st.session_state.get('selected_indicator'), 'id', None) != ind.id:
+                    st.session_state.selected_indicator = ind
+                    st.session_state.query_database = database_id
+                    st.toast(f"✅ Selected: {ind.name[:50]}...", icon="✅")
+                    # The Query tab lives outside this fragment
+                    st.rerun(scope="app")
+                st.info(f"💡 **{ind.name[:80]}** selected. **Next step:** Switch to '📊 Query & Visualize' tab above!")
+        else:
+            st.warning("⚠️ No indicators could be loaded.")
+
+
+@st.fragment
+def render_batch_selection():
+    """Batch tab pickers; changing a selection reruns only this block"""
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("### 📊 Select Indicators")
+        
+        batch_db = st.selectbox("Database", st.session_state.databases, key="batch_db_select",
+                                on_change=lambda: prefetch_indicators(st.session_state.batch_db_select))
+        
+        if st.button("📋 Load Indicators", key="batch_load_indicators", use_container_width=True):
+            with st.spinner("Loading indicators..."):
+                batch_indicators = get_indicators_with_metadata(batch_db)
+                st.session_state.batch_indicators_list = batch_indicators
+                st.session_state.batch_indicator_names = {ind.id: ind.name for ind in batch_indicators}
+                st.session_state.batch_indicator_labels = {
+                    ind.id: f"{ind.name[:50]}... ({ind.id})" for ind in batch_indicators
+                }
+                st.success(f"Loaded {len(st.session_state.batch_indicators_list)} indicators")
+        
+        if 'batch_indicator_labels' in st.session_state:
+            # Labels are cut once at load time, not per option on every rerun
+            indicator_labels = st.session_state.batch_indicator_labels
+            
+            selected_batch_indicators = st.multiselect(
+                "Select indicators (max 10)",
+                options=list(indicator_labels),
+                format_func=indicator_labels.__getitem__,
+                max_selections=10,
+                key="batch_indicators"
+            )
+        else:
+            selected_batch_indicators = []
+    
+    with col2:
+        st.markdown("### 🌍 Select Countries & Period")
+        
+        countries_batch = st.multiselect(
+            "Select countries",
+            options=list(COMMON_COUNTRIES.keys()),
+            default=["USA", "GBR", "DEU", "FRA", "JPN"],
+            format_func=lambda x: f"{country_name(x)} ({x})",
+            key="batch_countries_multi"
+        )
+        
+        if not countries_batch:
+            countries_batch = []
+        
+        year_range_batch = st.slider(
+            "Year Range",
+            min_value=1960,
+            max_value=2023,
+            value=(2010, 2023),
+            key="batch_year_range"
+        )
+        
+        if 'batch_indicators_list' in st.session_state and selected_batch_indicators and countries_batch:
+            years = year_range_batch[1] - year_range_batch[0] + 1
+            estimated = len(selected_batch_indicators) * len(countries_batch) * years
+            st.info(f"📊 Estimated records: ~{estimated:,}")
+
+
+# Button callbacks run before the rerun the click triggers, so no second st.rerun() is needed
+def close_explorer():
+    """Leave the indicator explorer"""
+    st.session_state.pop('exploring_database', None)
+    st.session_state.pop('exploring_db_name', None)
+
+
+def select_indicator(ind: IndicatorMeta):
+    """Pick ind for the Query tab"""
+    st.session_state.selected_indicator = with_details(ind)
+    st.session_state.query_database = ind.database_id
+    st.toast(f"✅ Selected: {ind.name[:40]}...")
+
+
+def clear_selected_indicator():
+    """Drop the indicator picked for querying"""
+    st.session_state.pop('selected_indicator', None)
+
+
+def clear_filters():
+    """Reset the theme and organization filters, including their widgets"""
+    st.session_state.selected_themes = []
+    st.session_state.selected_organizations = []
+    st.session_state.themes_multiselect = []
+    st.session_state.orgs_multiselect = []
+
+
 # ============================================================================
 # STREAMLIT APP
 # ============================================================================
@@ -1210,32 +2258,42 @@ st.set_page_config(
 )
 
 # CSS
-st.markdown("""
-    <style>
-    .main { background: linear-gradient(135deg, #0e1117 0%, #1a1d29 100%); }
-    .stApp { background: linear-gradient(135deg, #0e1117 0%, #1a1d29 100%); }
-    h1, h2, h3 { color: #ffffff; font-weight: 300; }
-    div[data-testid="stMetricValue"] { font-size: 28px; color: #4a9eff; }
-    .stButton > button {
-        background: linear-gradient(135deg, #4a9eff 0%, #3d7dd4 100%);
-        color: white; border: none; border-radius: 6px; font-weight: 500;
-    }
-    .tag {
-        display: inline-block; background: #2d3142; color: #4a9eff;
-        padding: 4px 12px; border-radius: 12px; font-size: 12px; margin: 2px;
-        border: 1px solid #4a9eff;
-    }
-    .database-badge {
-        display: inline-block; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-        color: white; padding: 4px 12px; border-radius: 12px; font-size: 11px;
-        font-weight: 600; margin: 2px;
-    }
-    </style>
-""", unsafe_allow_html=True)
+@st.cache_resource(show_spinner=False)
+def load_css() -> str:
+    """App stylesheet, read once per process"""
+    return Path(__file__).with_name("styles.css").read_text(encoding="utf-8")
+
+
+# Static HTML blocks
+_HEADER_HTML = """
+    <div style='text-align: center; padding: 20px 0;'>
+        <h1 style='font-size: 3rem; margin-bottom: 0; background: linear-gradient(90deg, #4a9eff 0%, #667eea 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;'>
+            🌍 Data360 Explorer
+        </h1>
+        <p style='color: #888; font-size: 1.1rem; margin-top: 10px;'>
+            Discover insights from 89 global databases • 13,607 indicators
+        </p>
+    </div>
+"""
+_EXPLORER_BANNER_HTML = """
+    <div id="explorer-top"></div>
+    <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
+        <h2 style='color: white; margin: 0;'>🔍 Exploring Indicators</h2>
+    </div>
+"""
+_SCROLL_DIVIDER_HTML = "<div style='text-align: center; margin: 30px 0;'><h3 style='color: #888;'>⬇️ Scroll down to browse other databases ⬇️</h3></div><hr>"
+_DIVIDER_BLUE_HTML = "<div style='text-align: center; margin: 20px 0;'><div style='height: 2px; background: linear-gradient(90deg, transparent, #4a9eff, transparent);'></div></div>"
+_DIVIDER_PURPLE_HTML = "<div style='text-align: center; margin: 20px 0;'><div style='height: 2px; background: linear-gradient(90deg, transparent, #667eea, transparent);'></div></div>"
+_FOOTER_HTML = """
+    <div style='text-align: center; color: #666; padding: 20px;'>
+        <p>🌍 <b>Data360 Explorer</b> | Powered by World Bank Data360 API</p>
+        <p>Made by @Gsnchez</p>
+    </div>
+"""
+
+st.markdown(f"<style>{load_css()}</style>", unsafe_allow_html=True)
 
 # Session State
-if 'client' not in st.session_state:
-    st.session_state.client = Data360Client()
 if 'databases' not in st.session_state:
     st.session_state.databases = None
 if 'selected_themes' not in st.session_state:
@@ -1244,6 +2302,11 @@ if 'selected_databases' not in st.session_state:
     st.session_state.selected_databases = []
 if 'selected_organizations' not in st.session_state:
     st.session_state.selected_organizations = []
+# The filter widgets take their value from these keys alone, so clear_filters() can reset them
+if 'themes_multiselect' not in st.session_state:
+    st.session_state.themes_multiselect = list(st.session_state.selected_themes)
+if 'orgs_multiselect' not in st.session_state:
+    st.session_state.orgs_multiselect = list(st.session_state.selected_organizations)
 if 'current_data' not in st.session_state:
     st.session_state.current_data = None
 if 'query_database' not in st.session_state:
@@ -1254,19 +2317,20 @@ if st.session_state.databases is None:
     with st.spinner("🔄 Loading databases..."):
         st.session_state.databases = discover_databases()
 
+st.sidebar.button("🧹 Clear cached data", key="clear_cache", use_container_width=True,
+                  help="Drop cached API responses, including those saved to disk", on_click=st.cache_data.clear)
+
+# Cache diagnostics for tuning TTLs, shown with ?debug=1
+if st.query_params.get("debug"):
+    with st.sidebar.expander("🧮 Cache stats", expanded=True):
+        st.dataframe(cache_stats(), use_container_width=True, hide_index=True)
+        st.dataframe(cache_hit_stats(), use_container_width=True, hide_index=True,
+                     column_config={"hit rate": st.column_config.NumberColumn(format="percent")})
+
 # Header
 col1, col2, col3 = st.columns([1, 3, 1])
 with col2:
-    st.markdown("""
-        <div style='text-align: center; padding: 20px 0;'>
-            <h1 style='font-size: 3rem; margin-bottom: 0; background: linear-gradient(90deg, #4a9eff 0%, #667eea 100%); -webkit-background-clip: text; -webkit-text-fill-color: transparent;'>
-                🌍 Data360 Explorer
-            </h1>
-            <p style='color: #888; font-size: 1.1rem; margin-top: 10px;'>
-                Discover insights from 89 global databases • 13,607 indicators
-            </p>
-        </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
 
 # Filters
 st.markdown("<div style='text-align: center; margin: 30px 0;'><h2 style='color: #4a9eff;'>🎯 Filters & Search</h2></div>", unsafe_allow_html=True)
@@ -1279,42 +2343,27 @@ with filter_col1:
 
 with filter_col2:
     st.markdown("#### 📚 Themes")
-    theme_counts = defaultdict(int)
-    for db_id, info in DATABASE_CATALOG.items():
-        for theme in info.get("themes", []):
-            theme_counts[theme] += 1
-    
-    theme_options = sorted(theme_counts.keys())
-    selected_themes_new = st.multiselect("Select themes", options=theme_options, default=st.session_state.selected_themes,
-                                        format_func=lambda x: f"{x} ({theme_counts[x]})", key="themes_multiselect", label_visibility="collapsed")
-    st.session_state.selected_themes = selected_themes_new
+    selected_themes = st.multiselect("Select themes", options=THEME_OPTIONS,
+                                     format_func=lambda x: f"{x} ({THEME_COUNTS[x]})", key="themes_multiselect", label_visibility="collapsed")
+    st.session_state.selected_themes = selected_themes
 
 with filter_col3:
     st.markdown("#### 🏢 Organizations")
-    org_counts = defaultdict(int)
-    for db_id, info in DATABASE_CATALOG.items():
-        org = info.get("organization", "Unknown")
-        org_counts[org] += 1
-    
-    org_options = sorted(org_counts.keys())
-    selected_orgs_new = st.multiselect("Select orgs", options=org_options, default=st.session_state.get('selected_organizations', []),
-                                      format_func=lambda x: f"{x} ({org_counts[x]})", key="orgs_multiselect", label_visibility="collapsed")
-    st.session_state.selected_organizations = selected_orgs_new
+    selected_orgs = st.multiselect("Select orgs", options=ORG_OPTIONS,
+                                   format_func=lambda x: f"{x} ({ORG_COUNTS[x]})", key="orgs_multiselect", label_visibility="collapsed")
+    st.session_state.selected_organizations = selected_orgs
 
 with filter_col4:
     st.markdown("#### 🔄")
-    if st.button("Clear All", use_container_width=True, key="clear_filters_main"):
-        st.session_state.selected_themes = []
-        st.session_state.selected_organizations = []
-        st.rerun()
+    st.button("Clear All", use_container_width=True, key="clear_filters_main", on_click=clear_filters)
 
 # Quick search functionality
 if main_search:
     with st.spinner(f"Searching for '{main_search}'..."):
         results, total = search_indicators_filtered(
             query=main_search,
-            themes=st.session_state.selected_themes if st.session_state.selected_themes else None,
-            organizations=st.session_state.selected_organizations if st.session_state.selected_organizations else None,
+            themes=tuple(selected_themes) or None,
+            organizations=tuple(selected_orgs) or None,
             limit=50
         )
         
@@ -1322,41 +2371,45 @@ if main_search:
             st.success(f"Found {len(results)} results for '{main_search}'")
             
             with st.expander(f"📋 View {len(results)} Search Results", expanded=True):
-                for result in results[:10]:
-                    col1, col2 = st.columns([5, 1])
-                    with col1:
-                        st.markdown(f"**{result['name']}**")
-                        st.caption(f"🆔 `{result['id']}` | 📊 {result['database_id']}")
-                    with col2:
-                        if st.button("Select", key=f"quick_search_{result['id']}", use_container_width=True):
-                            st.session_state.selected_indicator = result
-                            st.session_state.query_database = result['database_id']
-                            st.toast(f"✅ Selected: {result['name'][:40]}...")
-                    st.markdown("---")
+                # One text block plus one picker instead of columns and a button per result
+                shown = results[:10]
+                st.markdown("\n\n---\n\n".join(
+                    f"**{result.name}**  \n🆔 `{result.id}` | 📊 {result.database_id}" for result in shown
+                ))
+                st.markdown("---")
+                
+                col1, col2 = st.columns([5, 1])
+                with col1:
+                    choice = st.selectbox("Select indicator", options=range(len(shown)),
+                                          format_func=lambda i: f"{shown[i].name[:90]} ({shown[i].id})",
+                                          key="quick_search_choice", label_visibility="collapsed")
+                with col2:
+                    st.button("Select", key="quick_search_select", use_container_width=True,
+                              on_click=select_indicator, args=(shown[choice],))
                 
                 if len(results) > 10:
                     st.info(f"Showing 10 of {len(results)} results. Use filters to narrow down.")
 
 # Stats
-st.markdown("<div style='text-align: center; margin: 20px 0;'><div style='height: 2px; background: linear-gradient(90deg, transparent, #4a9eff, transparent);'></div></div>", unsafe_allow_html=True)
+st.markdown(_DIVIDER_BLUE_HTML, unsafe_allow_html=True)
 
 stat_col1, stat_col2, stat_col3, stat_col4, stat_col5 = st.columns(5)
 with stat_col1:
     st.metric("📊 Databases", len(st.session_state.databases))
 with stat_col2:
-    st.metric("📈 Indicators", "13,607")
+    st.metric("📈 Indicators", f"{total_indicators():,}")
 with stat_col3:
-    st.metric("🏢 Organizations", "27")
+    st.metric("🏢 Organizations", len(ORG_COUNTS))
 with stat_col4:
-    active_filters = len(st.session_state.selected_themes) + len(st.session_state.get('selected_organizations', []))
+    active_filters = len(selected_themes) + len(selected_orgs)
     st.metric("🎯 Active Filters", active_filters)
 with stat_col5:
-    filtered_count = sum(1 for db_id, info in DATABASE_CATALOG.items() if
-        (not st.session_state.get('selected_organizations') or info['organization'] in st.session_state.selected_organizations) and
-        (not st.session_state.selected_themes or any(theme in info.get('themes', []) for theme in st.session_state.selected_themes)))
-    st.metric("📁 Showing", filtered_count)
+    # Cached per filter combination (in any pick order) and reused by the catalog tab
+    filtered_codes, filtered_by_count, filtered_by_code = catalog_views(tuple(sorted(selected_orgs)),
+                                                                        tuple(sorted(selected_themes)))
+    st.metric("📁 Showing", len(filtered_codes))
 
-st.markdown("<div style='text-align: center; margin: 20px 0;'><div style='height: 2px; background: linear-gradient(90deg, transparent, #667eea, transparent);'></div></div>", unsafe_allow_html=True)
+st.markdown(_DIVIDER_PURPLE_HTML, unsafe_allow_html=True)
 
 # Tabs - 4 tabs
 tab1, tab2, tab3, tab4 = st.tabs(["🗂️ Browse Datasets", "📊 Query & Visualize", "🗄️ Database Catalog", "💾 Batch Download"])
@@ -1369,82 +2422,25 @@ with tab1:
     st.markdown("## Browse Datasets")
     
     if 'exploring_database' in st.session_state and st.session_state.exploring_database:
-        st.markdown('<div id="explorer-top"></div>', unsafe_allow_html=True)
-        
-        st.markdown("""
-            <div style='background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin-bottom: 20px;'>
-                <h2 style='color: white; margin: 0;'>🔍 Exploring Indicators</h2>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(_EXPLORER_BANNER_HTML, unsafe_allow_html=True)
         
         st.markdown(f"### {st.session_state.get('exploring_db_name', 'Database')}")
         
         col1, col2 = st.columns([4, 1])
         with col1:
-            db_info = DATABASE_CATALOG.get(st.session_state.exploring_database, {})
-            st.info(f"📊 Database: `{st.session_state.exploring_database}` | 🏢 {db_info.get('organization', 'Unknown')}")
+            db_info = DATABASE_CATALOG.get(st.session_state.exploring_database)
+            st.info(f"📊 Database: `{st.session_state.exploring_database}` | 🏢 {db_info.organization if db_info else 'Unknown'}")
         with col2:
-            if st.button("❌ Close Explorer", key="close_explore", use_container_width=True, type="secondary"):
-                del st.session_state.exploring_database
-                del st.session_state.exploring_db_name
-                st.session_state.scroll_to_top = True
-                st.rerun()
-        
-        with st.spinner(f"🔄 Loading indicators from {st.session_state.exploring_database}..."):
-            explore_indicators = get_indicators_with_metadata(st.session_state.exploring_database, limit=200)
-            
-            if explore_indicators:
-                st.success(f"✅ Loaded {len(explore_indicators)} indicators")
-                
-                col1, col2 = st.columns([3, 1])
-                with col1:
-                    indicator_search = st.text_input("🔎 Filter indicators", placeholder="e.g., population, GDP...", key="explore_indicator_search")
-                with col2:
-                    st.metric("Total", len(explore_indicators))
-                
-                if indicator_search:
-                    search_lower = indicator_search.lower()
-                    filtered_explore = [ind for ind in explore_indicators if search_lower in ind['name'].lower() or search_lower in ind['id'].lower() or (ind.get('description') and search_lower in ind['description'].lower())]
-                else:
-                    filtered_explore = explore_indicators[:50]
-                
-                st.markdown(f"### Showing {len(filtered_explore)} indicators")
-                
-                for ind in filtered_explore:
-                    with st.container():
-                        col1, col2 = st.columns([5, 1])
-                        
-                        with col1:
-                            st.markdown(f"**{ind['name']}**")
-                            st.caption(f"🆔 `{ind['id']}`")
-                            if ind.get('description') and ind['description'] != f"Indicator from {st.session_state.exploring_database}":
-                                desc_text = ind['description'][:200] + "..." if len(ind.get('description', '')) > 200 else ind.get('description', '')
-                                st.markdown(f"*{desc_text}*")
-                            if ind.get('topics') and any(ind.get('topics', [])):
-                                topics_html = " ".join([f'<span class="tag">{t}</span>' for t in ind['topics'][:3] if t])
-                                st.markdown(topics_html, unsafe_allow_html=True)
-                        
-                        with col2:
-                            if st.button("📊 Query", key=f"explore_query_{ind['id']}", use_container_width=True):
-                                st.session_state.selected_indicator = ind
-                                st.session_state.query_database = st.session_state.exploring_database
-                                st.toast(f"✅ Selected: {ind['name'][:50]}...", icon="✅")
-                                st.info("💡 **Next step:** Switch to '📊 Query & Visualize' tab above!")
-                        
-                        st.markdown("---")
-            else:
-                st.warning("⚠️ No indicators could be loaded.")
+            st.button("❌ Close Explorer", key="close_explore", use_container_width=True, type="secondary",
+                      on_click=close_explorer)
         
-        st.markdown("<div style='text-align: center; margin: 30px 0;'><h3 style='color: #888;'>⬇️ Scroll down to browse other databases ⬇️</h3></div>", unsafe_allow_html=True)
-        st.markdown("---")
-    
-    # Dataset list
-    st.markdown('<div id="datasets-list"></div>', unsafe_allow_html=True)
+        render_indicator_explorer(st.session_state.exploring_database)
+        
+        st.markdown(_SCROLL_DIVIDER_HTML, unsafe_allow_html=True)
     
-    if 'exploring_database' not in st.session_state or not st.session_state.exploring_database:
-        st.markdown("### Browse All Datasets")
-    else:
-        st.markdown("### Browse Other Datasets")
+    # Dataset list, with its scroll anchor in the same element as the heading
+    list_heading = "Browse Other Datasets" if st.session_state.get('exploring_database') else "Browse All Datasets"
+    st.markdown(f'<div id="datasets-list"></div>\n\n### {list_heading}', unsafe_allow_html=True)
     
     col1, col2, col3 = st.columns([3, 1, 1])
     
@@ -1455,42 +2451,51 @@ with tab1:
     with col3:
         items_per_page = st.selectbox("Per page", [10, 20, 50], index=1, key="items_per_page")
     
-    filtered_datasets = {}
-    for db_id, info in DATABASE_CATALOG.items():
-        if st.session_state.get('selected_organizations') and info['organization'] not in st.session_state.selected_organizations:
-            continue
-        if st.session_state.selected_themes and not any(theme in info.get('themes', []) for theme in st.session_state.selected_themes):
-            continue
-        if dataset_search:
-            if not (dataset_search.lower() in info['name'].lower() or dataset_search.lower() in info.get('description', '').lower()):
-                continue
-        filtered_datasets[db_id] = info
-    
-    sorted_datasets = sorted(filtered_datasets.items(), key=lambda x: x[1].get('indicator_count', 0) if "Count" in sort_by else x[1]['name'], reverse="High" in sort_by)
+    filtered_datasets = catalog_codes_matching(selected_orgs, selected_themes, dataset_search)
     
-    st.markdown(f"### Showing **{min(items_per_page, len(filtered_datasets))}** of **{len(filtered_datasets)}** datasets")
-    st.markdown("---")
+    if not filtered_datasets:
+        st.info("🔍 No datasets match the current search and filters.")
+        page_datasets = []
+    else:
+        page_count = math.ceil(len(filtered_datasets) / items_per_page)
+        if st.session_state.get('dataset_page', 1) > page_count:
+            st.session_state.dataset_page = page_count
+        
+        col1, col2 = st.columns([4, 1])
+        with col2:
+            if page_count > 1:
+                page = st.number_input("Page", min_value=1, max_value=page_count, step=1, key="dataset_page")
+            else:
+                page = 1
+        
+        page_start = (page - 1) * items_per_page
+        page_datasets = [(db_id, DATABASE_CATALOG[db_id])
+                         for db_id in catalog_page(filtered_datasets, "Count" in sort_by,
+                                                   page_start, page_start + items_per_page)]
+        
+        with col1:
+            st.markdown(f"### Showing **{len(page_datasets)}** of **{len(filtered_datasets)}** datasets (page {page} of {page_count})")
+        st.markdown("---")
     
-    for db_id, info in sorted_datasets[:items_per_page]:
+    for db_id, info in page_datasets:
         with st.container():
             col1, col2 = st.columns([5, 1])
             
             with col1:
-                st.markdown(f"### 🗂️ {info['name']}")
-                st.caption(f"**{info.get('indicator_count', 'N/A')}** Indicators")
-                st.markdown(f'<span class="database-badge">{info["organization"]}</span>', unsafe_allow_html=True)
-                st.markdown(f"*{info['description']}*")
-                if info.get('themes'):
-                    themes_html = " ".join([f'<span class="tag">{t}</span>' for t in info['themes'][:5]])
-                    st.markdown(themes_html, unsafe_allow_html=True)
+                st.markdown(f"### 🗂️ {info.name}")
+                st.caption(f"**{info.indicator_count}** Indicators")
+                st.markdown(f'<span class="database-badge">{info.organization}</span>', unsafe_allow_html=True)
+                st.markdown(f"*{info.description}*")
+                if info.themes:
+                    st.markdown(tags_html(info.themes[:5]), unsafe_allow_html=True)
                 st.caption(f"📊 Dataset ID: `{db_id}`")
             
             with col2:
-                st.markdown(f"**{info.get('indicator_count', 'N/A')}**")
+                st.markdown(f"**{info.indicator_count}**")
                 st.caption("INDICATORS")
                 if st.button("📈 Explore", key=f"dataset_explore_{db_id}", use_container_width=True):
                     st.session_state.exploring_database = db_id
-                    st.session_state.exploring_db_name = info['name']
+                    st.session_state.exploring_db_name = info.name
                     st.session_state.just_opened_explorer = True
             
             st.markdown("---")
@@ -1522,24 +2527,22 @@ with tab2:
         # Show what's selected
         col1, col2 = st.columns([5, 1])
         with col1:
-            st.success(f"✅ **Selected:** {ind['name']}")
-            st.caption(f"📊 Database: {DATABASE_CATALOG.get(ind['database_id'], {}).get('name', ind['database_id'])} | 🆔 `{ind['id']}`")
+            st.success(f"✅ **Selected:** {ind.name}")
+            st.caption(f"📊 Database: {database_name(ind.database_id)} | 🆔 `{ind.id}`")
         with col2:
-            if st.button("🔄 Change", key="change_indicator", use_container_width=True, help="Select a different indicator"):
-                del st.session_state.selected_indicator
-                st.rerun()
+            st.button("🔄 Change", key="change_indicator", use_container_width=True, help="Select a different indicator",
+                      on_click=clear_selected_indicator)
         
         # Show indicator details with availability check
         with st.expander("ℹ️ Indicator Details & Data Availability", expanded=True):
-            st.markdown(f"**Full Name:** {ind['name']}")
-            st.markdown(f"**ID:** `{ind['id']}`")
-            st.markdown(f"**Database:** {DATABASE_CATALOG.get(ind['database_id'], {}).get('name', ind['database_id'])}")
+            st.markdown(f"**Full Name:** {ind.name}")
+            st.markdown(f"**ID:** `{ind.id}`")
+            st.markdown(f"**Database:** {database_name(ind.database_id)}")
             
-            if ind.get('description'):
-                st.markdown(f"**Description:** {ind['description']}")
-            if ind.get('topics'):
-                topics_html = " ".join([f'<span class="tag">{t}</span>' for t in ind['topics'] if t])
-                st.markdown(topics_html, unsafe_allow_html=True)
+            if ind.description:
+                st.markdown(f"**Description:** {ind.description}")
+            if ind.topics:
+                st.markdown(tags_html(ind.topics), unsafe_allow_html=True)
             
             st.markdown("---")
             
@@ -1548,20 +2551,20 @@ with tab2:
             with col1:
                 st.markdown("### 📊 Data Availability")
             with col2:
-                check_availability = st.button("🔍 Check", key=f"check_avail_{ind['id']}", use_container_width=True, type="secondary")
+                check_availability = st.button("🔍 Check", key=f"check_avail_{ind.id}", use_container_width=True, type="secondary")
             
             if check_availability:
                 with st.spinner("Checking data availability..."):
-                    availability = check_data_availability(ind['database_id'], ind['id'])
+                    availability = check_data_availability(ind.database_id, ind.id)
                     
                     if availability:
-                        st.session_state[f"availability_{ind['id']}"] = availability
+                        st.session_state[f"availability_{ind.id}"] = availability
                     else:
                         st.warning("⚠️ Unable to check availability or no data found for this indicator.")
             
             # Display availability info if checked
-            if f"availability_{ind['id']}" in st.session_state:
-                avail = st.session_state[f"availability_{ind['id']}"]
+            if f"availability_{ind.id}" in st.session_state:
+                avail = st.session_state[f"availability_{ind.id}"]
                 
                 st.success(f"✅ Data available! **{avail['total_records']:,}** records found (sample)")
                 
@@ -1576,7 +2579,7 @@ with tab2:
                 # Show available countries
                 with st.expander(f"🌍 Available Countries ({avail['country_count']})", expanded=False):
                     countries_display = ", ".join([
-                        f"{COMMON_COUNTRIES.get(c, c)} ({c})" 
+                        f"{country_name(c)} ({c})" 
                         for c in avail['sample_countries']
                     ])
                     if avail['country_count'] > 10:
@@ -1611,19 +2614,7 @@ with tab2:
             countries_list = [c.strip().upper() for c in countries_input.split(",") if c.strip()]
             
             if countries_list:
-                with st.spinner(f"Fetching data for {ind['name'][:50]}..."):
-                    data = fetch_data_cached(ind['database_id'], ind['id'], countries_list, year_from, year_to)
-                    
-                    if data and len(data) > 0:
-                        st.session_state.current_data = data
-                        st.session_state.current_indicator_name = ind['name']
-                        st.session_state.current_indicator_id = ind['id']
-                        st.success(f"✅ Fetched {len(data)} records!")
-                        st.balloons()
-                        time.sleep(0.5)
-                        st.rerun()
-                    else:
-                        st.warning("⚠️ No data found. Try different countries or years.")
+                start_fetch_job(ind.database_id, ind.id, ind.name, countries_list, year_from, year_to)
             else:
                 st.error("❌ Please enter at least one country code")
     
@@ -1643,19 +2634,26 @@ with tab2:
             
             if 'last_selected_db' not in st.session_state:
                 st.session_state.last_selected_db = selected_db
+                prefetch_indicators(selected_db)
             
             if selected_db != st.session_state.last_selected_db:
                 st.session_state.last_selected_db = selected_db
                 st.session_state.query_database = selected_db
+                prefetch_indicators(selected_db)
                 st.session_state.pop('available_indicators', None)
+                st.session_state.pop('available_indicator_labels', None)
         
         with col2:
             if st.button("📋 Load Indicators", use_container_width=True, type="primary"):
                 with st.spinner("Loading..."):
-                    st.session_state.available_indicators = get_indicators_with_metadata(selected_db)
+                    # Keyed by id once here rather than re-indexed on every rerun of the selector
+                    st.session_state.available_indicators = {ind.id: ind for ind in get_indicators_with_metadata(selected_db)}
+                    st.session_state.available_indicator_labels = {
+                        ind.id: f"{ind.name[:90]}{'...' if len(ind.name) > 90 else ''}"
+                        for ind in st.session_state.available_indicators.values()
+                    }
                     st.session_state.query_database = selected_db
-                    st.success(f"✅ Loaded {len(st.session_state.available_indicators)} indicators")
-                    time.sleep(0.3)
+                    st.toast(f"✅ Loaded {len(st.session_state.available_indicators)} indicators")
                     st.rerun()
         
         with col3:
@@ -1666,27 +2664,26 @@ with tab2:
         if 'available_indicators' in st.session_state and st.session_state.available_indicators:
             st.markdown("---")
             
-            indicator_names = {ind['id']: ind['name'] for ind in st.session_state.available_indicators}
+            indicators_by_id = st.session_state.available_indicators
             
             selected_indicator_id = st.selectbox("Select Indicator",
-                                                options=list(indicator_names.keys()),
-                                                format_func=lambda x: f"{indicator_names[x][:90]}{'...' if len(indicator_names[x]) > 90 else ''}",
+                                                options=list(indicators_by_id),
+                                                format_func=st.session_state.available_indicator_labels.__getitem__,
                                                 key="query_indicator_select")
             
-            selected_ind_details = next((ind for ind in st.session_state.available_indicators if ind['id'] == selected_indicator_id), None)
+            selected_ind_details = indicators_by_id.get(selected_indicator_id)
             
             if selected_ind_details:
                 # Show indicator details with availability check (same as above)
                 with st.expander("ℹ️ Indicator Details & Data Availability", expanded=True):
-                    st.markdown(f"**Name:** {selected_ind_details['name']}")
-                    st.markdown(f"**ID:** `{selected_ind_details['id']}`")
-                    st.markdown(f"**Database:** {DATABASE_CATALOG.get(selected_ind_details['database_id'], {}).get('name', selected_ind_details['database_id'])}")
+                    st.markdown(f"**Name:** {selected_ind_details.name}")
+                    st.markdown(f"**ID:** `{selected_ind_details.id}`")
+                    st.markdown(f"**Database:** {database_name(selected_ind_details.database_id)}")
                     
-                    if selected_ind_details.get('description'):
-                        st.markdown(f"**Description:** {selected_ind_details['description']}")
-                    if selected_ind_details.get('topics'):
-                        topics_html = " ".join([f'<span class="tag">{t}</span>' for t in selected_ind_details['topics'] if t])
-                        st.markdown(topics_html, unsafe_allow_html=True)
+                    if selected_ind_details.description:
+                        st.markdown(f"**Description:** {selected_ind_details.description}")
+                    if selected_ind_details.topics:
+                        st.markdown(tags_html(selected_ind_details.topics), unsafe_allow_html=True)
                     
                     st.markdown("---")
                     
@@ -1695,20 +2692,20 @@ with tab2:
                     with col1:
                         st.markdown("### 📊 Data Availability")
                     with col2:
-                        check_availability_manual = st.button("🔍 Check", key=f"check_avail_manual_{selected_ind_details['id']}", use_container_width=True, type="secondary")
+                        check_availability_manual = st.button("🔍 Check", key=f"check_avail_manual_{selected_ind_details.id}", use_container_width=True, type="secondary")
                     
                     if check_availability_manual:
                         with st.spinner("Checking data availability..."):
-                            availability = check_data_availability(selected_ind_details['database_id'], selected_ind_details['id'])
+                            availability = check_data_availability(selected_ind_details.database_id, selected_ind_details.id)
                             
                             if availability:
-                                st.session_state[f"availability_{selected_ind_details['id']}"] = availability
+                                st.session_state[f"availability_{selected_ind_details.id}"] = availability
                             else:
                                 st.warning("⚠️ Unable to check availability or no data found for this indicator.")
                     
                     # Display availability info if checked
-                    if f"availability_{selected_ind_details['id']}" in st.session_state:
-                        avail = st.session_state[f"availability_{selected_ind_details['id']}"]
+                    if f"availability_{selected_ind_details.id}" in st.session_state:
+                        avail = st.session_state[f"availability_{selected_ind_details.id}"]
                         
                         st.success(f"✅ Data available! **{avail['total_records']:,}** records found (sample)")
                         
@@ -1723,7 +2720,7 @@ with tab2:
                         # Show available countries
                         with st.expander(f"🌍 Available Countries ({avail['country_count']})", expanded=False):
                             countries_display = ", ".join([
-                                f"{COMMON_COUNTRIES.get(c, c)} ({c})" 
+                                f"{country_name(c)} ({c})" 
                                 for c in avail['sample_countries']
                             ])
                             if avail['country_count'] > 10:
@@ -1755,80 +2752,77 @@ with tab2:
                     countries_list = [c.strip().upper() for c in countries_input.split(",") if c.strip()]
                     
                     if countries_list:
-                        with st.spinner("Fetching..."):
-                            data = fetch_data_cached(selected_db, selected_indicator_id, countries_list, year_from, year_to)
-                            
-                            if data and len(data) > 0:
-                                st.session_state.current_data = data
-                                st.session_state.current_indicator_name = indicator_names[selected_indicator_id]
-                                st.session_state.current_indicator_id = selected_indicator_id
-                                st.success(f"✅ Fetched {len(data)} records!")
-                                st.balloons()
-                                time.sleep(0.5)
-                                st.rerun()
-                            else:
-                                st.warning("⚠️ No data found")
+                        start_fetch_job(selected_db, selected_indicator_id, selected_ind_details.name,
+                                        countries_list, year_from, year_to)
                     else:
                         st.error("❌ Enter at least one country")
     
+    # Long fetches run in the background; the fragment polls them without blocking the app
+    if 'fetch_job' in st.session_state:
+        render_fetch_job()
+    if 'fetch_warning' in st.session_state:
+        st.warning(st.session_state.pop('fetch_warning'))
+    
     # VISUALIZATIONS - Show if we have data
-    if 'current_data' in st.session_state and st.session_state.current_data:
+    if st.session_state.get('current_data') is not None:
         st.markdown("---")
         st.markdown("## 📊 Data Visualization")
         
         indicator_name = st.session_state.get('current_indicator_name', 'Selected Indicator')
-        df = pd.DataFrame(st.session_state.current_data)
+        df = st.session_state.current_data
+        data_key = st.session_state.get('current_data_key') or frame_key(df)
+        summary = summarize_frame(df, data_key)
         
-        if len(df) == 0:
-            st.warning("⚠️ No records returned")
-        else:
-            df['OBS_VALUE'] = pd.to_numeric(df['OBS_VALUE'], errors='coerce')
-            df['TIME_PERIOD'] = df['TIME_PERIOD'].astype(str)
-            df = df.dropna(subset=['OBS_VALUE'])
-            
-            if len(df) == 0:
-                st.warning("⚠️ No valid numeric data found")
+        # Data summary
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("📈 Total Records", f"{summary['records']:,}")
+        with col2:
+            st.metric("🌍 Countries", summary['countries'])
+        with col3:
+            st.metric("📅 Time Range", summary['time_range'])
+        with col4:
+            st.metric("📊 Avg Value", f"{summary['mean']:.2f}")
+        
+        # Visualization tabs
+        viz_tab1, viz_tab2, viz_tab3 = st.tabs(["📈 Time Series", "📊 Comparison", "📋 Data Table"])
+        
+        with viz_tab1:
+            fig = create_time_series_plot(df, data_key, "Time Series Analysis", indicator_name)
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with viz_tab2:
+            available_years = summary['years']
+            if len(available_years) > 0:
+                selected_year = st.selectbox("Select Year", available_years, key="comparison_year")
+                fig = create_comparison_chart(df, data_key, selected_year, "Country Comparison")
+                st.plotly_chart(fig, use_container_width=True)
             else:
-                # Data summary
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("📈 Total Records", f"{len(df):,}")
-                with col2:
-                    st.metric("🌍 Countries", df['REF_AREA'].nunique())
-                with col3:
-                    st.metric("📅 Time Range", f"{df['TIME_PERIOD'].min()}-{df['TIME_PERIOD'].max()}")
-                with col4:
-                    st.metric("📊 Avg Value", f"{df['OBS_VALUE'].mean():.2f}")
-                
-                # Visualization tabs
-                viz_tab1, viz_tab2, viz_tab3 = st.tabs(["📈 Time Series", "📊 Comparison", "📋 Data Table"])
-                
-                with viz_tab1:
-                    fig = create_time_series_plot(df, "Time Series Analysis", indicator_name)
-                    st.plotly_chart(fig, use_container_width=True)
-                
-                with viz_tab2:
-                    available_years = sorted(df['TIME_PERIOD'].unique(), reverse=True)
-                    if len(available_years) > 0:
-                        selected_year = st.selectbox("Select Year", available_years, key="comparison_year")
-                        fig = create_comparison_chart(df, selected_year, "Country Comparison")
-                        st.plotly_chart(fig, use_container_width=True)
-                    else:
-                        st.warning("No year data available")
-                
-                with viz_tab3:
-                    st.dataframe(df, use_container_width=True, height=500)
-                
-                # Download button
-                st.markdown("---")
-                csv = df.to_csv(index=False)
-                st.download_button(
-                    "📥 Download Data (CSV)",
-                    csv,
-                    f"data360_{st.session_state.get('current_indicator_id', 'data')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    "text/csv",
-                    use_container_width=True
-                )
+                st.warning("No year data available")
+        
+        with viz_tab3:
+            # Only one page of rows is sent to the browser; the CSV below has everything
+            page_size = 100
+            page_count = max(1, math.ceil(len(df) / page_size))
+            if st.session_state.get('data_table_page', 1) > page_count:
+                st.session_state.data_table_page = page_count
+            page = 1
+            if page_count > 1:
+                page = st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count,
+                                       step=1, key="data_table_page")
+            st.dataframe(df.iloc[(page - 1) * page_size:page * page_size], use_container_width=True, height=500)
+            st.caption(f"Rows {(page - 1) * page_size + 1:,}-{min(page * page_size, len(df)):,} of {len(df):,}")
+        
+        # Download button
+        st.markdown("---")
+        csv_data = frame_csv(df, data_key)
+        st.download_button(
+            "📥 Download Data (CSV)",
+            csv_data,
+            f"data360_{st.session_state.get('current_indicator_id', 'data')}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+            "text/csv",
+            use_container_width=True
+        )
 
 
 # ============================================================================
@@ -1839,16 +2833,15 @@ with tab3:
     st.markdown("## 🗂️ Database Catalog")
     st.markdown("Browse all available databases and their characteristics")
     
-    display_databases = {}
-    for db_id, info in DATABASE_CATALOG.items():
-        if st.session_state.get('selected_organizations') and info['organization'] not in st.session_state.selected_organizations:
-            continue
-        
-        if st.session_state.selected_themes:
-            if not any(theme in info.get('themes', []) for theme in st.session_state.selected_themes):
-                continue
-        
-        display_databases[db_id] = info
+    if st.button("⚡ Preload all indicator lists", key="preload_all_catalogs"):
+        with st.spinner(f"Loading indicators for {len(st.session_state.databases)} databases..."):
+            loaded = warmup_all_catalogs(st.session_state.databases)
+        st.success(f"✅ Preloaded {loaded} of {len(st.session_state.databases)} databases")
+    
+    display_databases = {
+        db_id: DATABASE_CATALOG[db_id]
+        for db_id in filtered_codes
+    }
     
     col1, col2, col3, col4 = st.columns(4)
     with col1:
@@ -1856,7 +2849,7 @@ with tab3:
     with col2:
         st.metric("Showing", len(display_databases))
     with col3:
-        org_count = len(set(info.get('organization', 'Unknown') for info in display_databases.values()))
+        org_count = len(set(info.organization for info in display_databases.values()))
         st.metric("Organizations", org_count)
     with col4:
         st.metric("Themes", len(THEME_TAXONOMY))
@@ -1865,43 +2858,39 @@ with tab3:
     
     st.markdown("### ⭐ Featured Databases")
     
-    sorted_dbs = sorted(display_databases.items(), key=lambda x: x[1].get('indicator_count', 0), reverse=True)
-    
-    for db_id, info in sorted_dbs:
-        with st.expander(f"**{info['name']}** ({db_id})", expanded=False):
+    for db_id in filtered_by_count:
+        info = display_databases[db_id]
+        with st.expander(f"**{info.name}** ({db_id})", expanded=False):
             col1, col2 = st.columns([3, 1])
             
             with col1:
-                st.markdown(f"**Organization:** {info['organization']}")
-                st.markdown(f"**Description:** {info['description']}")
+                st.markdown(f"**Organization:** {info.organization}")
+                st.markdown(f"**Description:** {info.description}")
                 
-                if info.get('themes'):
-                    themes_html = " ".join([f'<span class="tag">{t}</span>' for t in info['themes']])
-                    st.markdown(f"**Themes:** {themes_html}", unsafe_allow_html=True)
+                if info.themes:
+                    st.markdown(f"**Themes:** {tags_html(info.themes)}", unsafe_allow_html=True)
             
             with col2:
-                if info.get('indicator_count'):
-                    st.metric("Indicators", info['indicator_count'])
+                if info.indicator_count:
+                    st.metric("Indicators", info.indicator_count)
                 
                 if st.button("Explore", key=f"catalog_explore_{db_id}", use_container_width=True):
                     st.session_state.exploring_database = db_id
-                    st.session_state.exploring_db_name = info['name']
-                    st.success(f"✅ Loading {info['name']}...")
-                    st.info("🔄 Switching to 'Browse Datasets' tab...")
-                    time.sleep(0.5)
+                    st.session_state.exploring_db_name = info.name
+                    st.toast(f"✅ Opened {info.name} in the 'Browse Datasets' tab")
                     st.rerun()
     
     st.markdown("---")
     st.markdown("### 📚 All Databases")
     
-    if st.session_state.get('selected_organizations') or st.session_state.selected_themes:
+    if selected_orgs or selected_themes:
         st.info(f"Showing {len(display_databases)} databases matching your filters")
     
     cols = st.columns(5)
-    for idx, db in enumerate(sorted(display_databases.keys())):
+    for idx, db in enumerate(filtered_by_code):
         with cols[idx % 5]:
             if st.button(db, key=f"catalog_db_{db}", use_container_width=True):
-                st.info(f"Selected: {display_databases[db]['name']}")
+                st.info(f"Selected: {display_databases[db].name}")
 
 
 # ============================================================================
@@ -1912,57 +2901,14 @@ with tab4:
     st.markdown("## 💾 Batch Data Download")
     st.markdown("Download data for multiple indicators and countries efficiently")
     
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        st.markdown("### 📊 Select Indicators")
-        
-        batch_db = st.selectbox("Database", st.session_state.databases, key="batch_db_select")
-        
-        if st.button("📋 Load Indicators", key="batch_load_indicators", use_container_width=True):
-            with st.spinner("Loading indicators..."):
-                st.session_state.batch_indicators_list = get_indicators_with_metadata(batch_db, limit=500)
-                st.success(f"Loaded {len(st.session_state.batch_indicators_list)} indicators")
-        
-        if 'batch_indicators_list' in st.session_state:
-            indicator_options = {ind['id']: ind['name'] for ind in st.session_state.batch_indicators_list}
-            
-            selected_batch_indicators = st.multiselect(
-                "Select indicators (max 10)",
-                options=list(indicator_options.keys()),
-                format_func=lambda x: f"{indicator_options[x][:50]}... ({x})",
-                max_selections=10,
-                key="batch_indicators"
-            )
-        else:
-            selected_batch_indicators = []
+    render_batch_selection()
     
-    with col2:
-        st.markdown("### 🌍 Select Countries & Period")
-        
-        countries_batch = st.multiselect(
-            "Select countries",
-            options=list(COMMON_COUNTRIES.keys()),
-            default=["USA", "GBR", "DEU", "FRA", "JPN"],
-            format_func=lambda x: f"{COMMON_COUNTRIES[x]} ({x})",
-            key="batch_countries_multi"
-        )
-        
-        if not countries_batch:
-            countries_batch = []
-        
-        year_range_batch = st.slider(
-            "Year Range",
-            min_value=1960,
-            max_value=2023,
-            value=(2010, 2023),
-            key="batch_year_range"
-        )
-        
-        if 'batch_indicators_list' in st.session_state and selected_batch_indicators and countries_batch:
-            years = year_range_batch[1] - year_range_batch[0] + 1
-            estimated = len(selected_batch_indicators) * len(countries_batch) * years
-            st.info(f"📊 Estimated records: ~{estimated:,}")
+    # The pickers live in a fragment, so read their current values back from session state
+    batch_db = st.session_state.batch_db_select
+    selected_batch_indicators = (st.session_state.get('batch_indicators', [])
+                                 if 'batch_indicator_labels' in st.session_state else [])
+    countries_batch = st.session_state.batch_countries_multi
+    year_range_batch = st.session_state.batch_year_range
     
     st.markdown("---")
     
@@ -1978,38 +2924,56 @@ with tab4:
             progress_bar = st.progress(0)
             status_text = st.empty()
             
-            all_batch_data = []
-            total_queries = len(selected_batch_indicators) * len(countries_batch)
+            # Each distinct indicator/country is fetched once, whatever the selection repeats
+            batch_indicators = list(dict.fromkeys(selected_batch_indicators))
+            batch_countries = list(dict.fromkeys(countries_batch))
+            results = {}
+            total_queries = len(batch_indicators)
             completed = 0
+            last_update = 0.0
             
-            indicator_options_map = {ind['id']: ind['name'] for ind in st.session_state.batch_indicators_list}
+            indicator_options_map = st.session_state.batch_indicator_names
             
-            for indicator in selected_batch_indicators:
-                indicator_name = indicator_options_map.get(indicator, indicator)[:30]
-                
-                for country in countries_batch:
-                    status_text.text(f"⏳ Fetching: {indicator_name}... for {COMMON_COUNTRIES.get(country, country)}")
-                    
+            # One multi-country request per indicator, with the indicators fetched side by side
+            with ThreadPoolExecutor(max_workers=min(Data360Client.MAX_WORKERS, total_queries)) as executor:
+                futures = {
+                    executor.submit(fetch_data_cached, batch_db, indicator, batch_countries,
+                                    str(year_range_batch[0]), str(year_range_batch[1])): indicator
+                    for indicator in batch_indicators
+                }
+                for future in as_completed(futures):
+                    indicator = futures[future]
                     try:
-                        data = fetch_data_cached(
-                            batch_db,
-                            indicator,
-                            [country],
-                            str(year_range_batch[0]),
-                            str(year_range_batch[1])
-                        )
-                        all_batch_data.extend(data)
+                        data = future.result()
+                        if len(data) > 0:
+                            results[indicator] = data
+                        failed = data.attrs.get("failed", [])
+                        if failed:
+                            st.warning(f"⚠️ Failed: {indicator} - {', '.join(failed)}")
+                        returned = set(data['REF_AREA'].unique()) if len(data) > 0 else set()
+                        missing = [country for country in batch_countries
+                                   if country not in returned and country not in failed]
+                        if missing:
+                            st.warning(f"⚠️ No data: {indicator} - {', '.join(missing)}")
                     except Exception as e:
-                        st.warning(f"⚠️ Failed: {indicator} - {country}: {str(e)}")
+                        st.warning(f"⚠️ Failed: {indicator}: {str(e)}")
                     
                     completed += 1
-                    progress_bar.progress(completed / total_queries)
-                    time.sleep(0.05)
+                    # Cached indicators finish together; redraw at most every 250 ms
+                    now = time.monotonic()
+                    if now - last_update > 0.25 or completed == total_queries:
+                        last_update = now
+                        progress_bar.progress(completed / total_queries)
+                        status_text.text(f"⏳ Fetched: {indicator_options_map.get(indicator, indicator)[:30]}... "
+                                         f"({completed}/{total_queries} indicators)")
             
             status_text.text("✅ Batch download complete!")
             
+            # Selection order, not completion order
+            all_batch_data = [results[indicator] for indicator in batch_indicators if indicator in results]
+            
             if all_batch_data:
-                df_batch = pd.DataFrame(all_batch_data)
+                df_batch = pd.concat(all_batch_data, ignore_index=True)
                 
                 col1, col2, col3 = st.columns(3)
                 with col1:
@@ -2022,7 +2986,7 @@ with tab4:
                 st.markdown("### 📋 Preview")
                 st.dataframe(df_batch.head(100), use_container_width=True, height=400)
                 
-                csv_batch = df_batch.to_csv(index=False)
+                csv_batch = frame_csv(df_batch, frame_key(df_batch))
                 st.download_button(
                     "📥 Download Complete Dataset (CSV)",
                     csv_batch,
@@ -2036,9 +3000,4 @@ with tab4:
 
 # Footer
 st.markdown("---")
-st.markdown(f"""
-    <div style='text-align: center; color: #666; padding: 20px;'>
-        <p>🌍 <b>Data360 Explorer</b> | Powered by World Bank Data360 API</p>
-        <p>Made by @Gsnchez</p>
-    </div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)